@@ -14,6 +14,9 @@ def with_known(known: list[Field], orig: Cls) -> "Table[Cls]":
     ):
         __known__ = known
 
+    Wrapped.__name__ = orig.__name__
+    Wrapped.__module__ = orig.__module__
+    Wrapped.__qualname__ = orig.__qualname__
     return Wrapped
 
 
@@ -1,19 +1,21 @@
 from collections.abc import Generator
-from typing import Annotated, Generic, TypeVar
+from typing import TYPE_CHECKING, Annotated, Generic, Optional, TypeVar, Union
 
 from beartype import beartype
 from beartype.vale import Is
 from pyarrow import Array as _Array
 from pyarrow import Table as _Table
-from pyarrow import field as _field
-from pyarrow import schema as _schema
 
 from tableclasses.base.field import FieldMeta
+from tableclasses.base.hooks import NullRecorder, Recorder, recorder
+from tableclasses.base.quarantine import Quarantined, rejections
 from tableclasses.base.tabled import Base
-from tableclasses.errs import ColumnError, GetRepr
-from tableclasses.pandas.tabled import get_column, must_get_col
+from tableclasses.base.utils import get_column, get_table, must_get_col
 from tableclasses.types import Cls
 
+if TYPE_CHECKING:
+    from tableclasses.base.sketches import TableStats
+
 ColumnArgs = TypeVar("ColumnArgs", _Array, list, Generator)
 NamedColumns = dict[str, ColumnArgs]
 
@@ -23,13 +25,6 @@ def allowed_repr(meta: FieldMeta):
     return f"(pa.Array[{typ}] | list[{typ}] | Generator[{typ}])"
 
 
-def get_table(other: _Table, name: str, meta: FieldMeta, get_repr: GetRepr):
-    col = other.column(name)
-    if col is None:
-        raise ColumnError(meta, get_repr, col)
-    return col
-
-
 def valid_cols(cols: NamedColumns):
     for col in cols.values():
         if not isinstance(col, (_Array, Generator, list)):
@@ -40,36 +35,69 @@ def valid_cols(cols: NamedColumns):
 class Table(Generic[Cls], Base[Cls, _Table], _Table):
     @beartype
     @classmethod
-    def from_columns(cls, columns: Annotated[NamedColumns, Is[valid_cols]]):
+    def from_columns(
+        cls,
+        columns: Annotated[NamedColumns, Is[valid_cols]],
+        stats: Union[bool, list, None] = None,
+        errors: str = "raise",
+    ):
+        rejected = rejections(errors)
+        record = recorder(cls, "from_columns", columns)
         cols = []
-        schemas = []
         cls.validate_allowed(columns.keys())
+        record.mark("validate")
         for field in cls.__known__:
             meta = FieldMeta(**field.metadata)
             cols.append(must_get_col(get_column, columns, meta, allowed_repr))
-            schemas.append(_field(meta.col_name, meta.arrow))
-        return _Table.from_arrays(
-            cols,
-            schema=_schema(
-                schemas,
-            ),
-        )
+        record.mark("resolve")
+        if rejected is not None:
+            table = cls.quarantine(cols, rejected)
+            record.mark("quarantine")
+            return Quarantined(cls._from_columns(table.columns, record, cls.collect_stats(stats)), rejected.to_table())
+        return cls._from_columns(cols, record, cls.collect_stats(stats))
 
     @beartype
     @classmethod
     def from_existing(cls, other: _Table):
+        record = recorder(cls, "from_existing", other)
         cols = []
-        schemas = []
         cls.validate_allowed([c.name for c in other.schema])
+        record.mark("validate")
         for field in cls.__known__:
             meta = FieldMeta(**field.metadata)
             col = must_get_col(get_table, other, meta, allowed_repr)
             cols.append(col)
-            schemas.append(_field(meta.col_name, meta.arrow))
+        record.mark("resolve")
+        return cls._from_columns(cols, record)
 
-        return _Table.from_arrays(
+    @classmethod
+    def _from_columns(
+        cls,
+        cols: list,
+        record: Union[Recorder, NullRecorder],
+        stats: Optional["TableStats"] = None,
+    ) -> _Table:
+        table = _Table.from_arrays(
             cols,
-            schema=_schema(
-                schemas,
-            ),
+            schema=cls.arrow_schema(),
         )
+        record.mark("convert")
+        cls.check_constraints(table)
+        record.mark("constraints")
+        if stats is not None:
+            from tableclasses.base.sketches import remember  # noqa: PLC0415
+
+            remember(table, stats.update(table))
+            record.mark("stats")
+        record.emit(table.num_rows, table.nbytes)
+        return table
+
+    @classmethod
+    def _to_arrow(cls, data: _Table) -> _Table:
+        if data.schema.equals(cls.arrow_schema()):
+            return data
+        return cls.from_existing(data)
+
+    @classmethod
+    def _from_arrow(cls, table: _Table) -> _Table:
+        return cls.from_existing(table)
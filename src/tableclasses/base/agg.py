@@ -0,0 +1,63 @@
+from typing import Optional, Union
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from tableclasses.base.expr import Column, Columns
+from tableclasses.errs import DataError
+
+Target = Union[None, str, Column]
+Aggregation = Union[
+    str,
+    tuple[Target, str],
+    tuple[Target, str, Optional[pc.FunctionOptions]],
+]
+Aggregations = dict[str, Aggregation]
+
+COUNT = {"count": (None, "count_all")}
+
+
+def resolve_aggregations(
+    columns: Columns, aggs: Aggregations
+) -> list[tuple[str, list[str], str, Optional[pc.FunctionOptions]]]:
+    resolved = []
+    for key, agg in aggs.items():
+        if isinstance(agg, str):
+            # {"amount": "sum"} aggregates the column `amount` into `amount_sum`
+            target, func, opts = key, agg, None
+            name = f"{columns[key].name}_{func}"
+        elif isinstance(agg, tuple) and len(agg) in (2, 3):
+            target, func, opts = (*agg, None)[:3]
+            name = key
+        else:
+            err = f"{agg!r} is not a valid aggregation for {key}, expected func | (column, func[, options])"
+            raise DataError(err)
+        try:
+            pc.get_function(f"hash_{func}")
+        except (pa.ArrowKeyError, KeyError) as e:
+            err = f"{func!r} is not a known aggregation for {key}"
+            raise DataError(err) from e
+        target = [] if target is None else [columns[target].name]
+        resolved.append((name, target, func, opts))
+    return resolved
+
+
+def group_by(
+    table: pa.Table,
+    keys: list[str],
+    aggs: list[tuple[str, list[str], str, Optional[pc.FunctionOptions]]],
+) -> pa.Table:
+    names = keys + [name for (name, *_) in aggs]
+    if len(set(names)) != len(names):
+        err = "({:}) produce duplicate column names".format(",".join(names))
+        raise DataError(err)
+    grouped = pa.TableGroupBy(table, keys, use_threads=True).aggregate(
+        [(target, func, opts) for (_, target, func, opts) in aggs]
+    )
+    # pyarrow places the keys before or after the aggregates depending on version
+    n = len(keys)
+    if grouped.column_names[:n] == keys:
+        key_cols, agg_cols = grouped.columns[:n], grouped.columns[n:]
+    else:
+        key_cols, agg_cols = grouped.columns[-n:] if n else [], grouped.columns[: len(aggs)]
+    return pa.Table.from_arrays([*key_cols, *agg_cols], names=names)
@@ -0,0 +1,84 @@
+from collections.abc import Iterator
+from typing import Callable, Union
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from tableclasses.base.field import FieldMeta
+from tableclasses.errs import DataError
+
+Column = Union[pa.Array, pa.ChunkedArray]
+Check = Callable[[Column], Column]
+
+
+def literal(meta: FieldMeta, name: str, value: any) -> pa.Scalar:
+    try:
+        return pa.scalar(value, type=meta.arrow_type)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError) as e:
+        err = f"({meta.col_name}) {name}={value!r} is not a {meta.arrow_type}"
+        raise DataError(err) from e
+
+
+def duplicated(col: Column) -> Column:
+    counts = pc.value_counts(col)
+    repeated = counts.field("values").filter(pc.greater(counts.field("counts"), 1))
+    return pc.is_in(col, value_set=repeated, skip_nulls=True)
+
+
+def compile_checks(meta: FieldMeta) -> list[tuple[str, Check]]:
+    # every check returns a mask that is true where a row violates the constraint, nulls only fail not_null
+    checks = []
+    if meta.not_null:
+        checks.append(("not_null", pc.is_null))
+    if meta.ge is not None:
+        ge = literal(meta, "ge", meta.ge)
+        checks.append(("ge", lambda col: pc.less(col, ge)))
+    if meta.le is not None:
+        le = literal(meta, "le", meta.le)
+        checks.append(("le", lambda col: pc.greater(col, le)))
+    if meta.pattern is not None:
+        pattern = meta.pattern
+        checks.append(("pattern", lambda col: pc.invert(pc.match_substring_regex(col, pattern))))
+    if meta.isin is not None:
+        try:
+            allowed = pa.array(meta.isin, type=meta.arrow_type)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError) as e:
+            err = f"({meta.col_name}) isin={meta.isin!r} are not {meta.arrow_type}"
+            raise DataError(err) from e
+        checks.append(("isin", lambda col: pc.and_(pc.is_valid(col), pc.invert(pc.is_in(col, value_set=allowed)))))
+    if meta.unique:
+        checks.append(("unique", duplicated))
+    return checks
+
+
+def compile_constraints(known: list) -> list[tuple[str, list[tuple[str, Check]]]]:
+    constraints = []
+    for field in known:
+        meta = FieldMeta(**field.metadata)
+        checks = compile_checks(meta)
+        if len(checks) > 0:
+            constraints.append((meta.col_name, checks))
+    return constraints
+
+
+def violations(
+    table: pa.Table, constraints: list[tuple[str, list[tuple[str, Check]]]]
+) -> Iterator[tuple[str, str, Column]]:
+    for name, checks in constraints:
+        col = table.column(name)
+        for constraint, check in checks:
+            violated = pc.fill_null(check(col), False)
+            if pc.any(violated).as_py():
+                yield name, constraint, violated
+
+
+def check_constraints(table: pa.Table, constraints: list[tuple[str, list[tuple[str, Check]]]]):
+    masks = {}
+    failed = []
+    for name, constraint, violated in violations(table, constraints):
+        failed.append(f"{name}.{constraint}")
+        mask = masks.get(name)
+        masks[name] = violated if mask is None else pc.or_(mask, violated)
+    if len(masks) > 0:
+        err = "({:}) constraints are violated".format(",".join(failed))
+        raise DataError(err, masks)
@@ -0,0 +1,99 @@
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any, Generic, Optional, Union
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+from tableclasses.base.expr import Predicate, Where, as_predicate
+from tableclasses.base.spill import collect
+from tableclasses.errs import DataError
+from tableclasses.types import Cls
+
+if TYPE_CHECKING:
+    from tableclasses.base.stream import Stream
+    from tableclasses.base.tabled import Base
+
+Columns = Union[list[str], dict[str, Any], None]
+
+
+def partitioning(schema: pa.Schema, partition_by: Optional[list[str]]) -> Optional[ds.Partitioning]:
+    if not partition_by:
+        return None
+    return ds.partitioning(pa.schema([schema.field(name) for name in partition_by]), flavor="hive")
+
+
+def discover(
+    model: "type[Base]", root: Any, fmt: str, parts: Union[str, ds.Partitioning, None], **kwargs: Any
+) -> ds.Dataset:
+    # files are listed once, with the model schema typing both the partition keys and the file columns
+    found = ds.dataset(root, schema=model.arrow_schema(), format=fmt, partitioning=parts, **kwargs)
+    fragment = next(iter(found.get_fragments()), None)
+    if fragment is None:
+        return found
+    names = fragment.physical_schema.names + list(ds.get_partition_keys(fragment.partition_expression))
+    model.validate_allowed(names)
+    missing = [name for name in model.arrow_schema().names if name not in names]
+    if len(missing) > 0:
+        err = "({:}, ...) are missing from the dataset".format(",".join(missing))
+        raise DataError(err)
+    return found
+
+
+class Dataset(Generic[Cls]):
+    def __init__(self, model: "type[Base]", dataset: ds.Dataset, where: Optional[Predicate] = None):
+        self.model = model
+        self.dataset = dataset
+        self.where = where
+
+    @property
+    def schema(self) -> pa.Schema:
+        return self.dataset.schema
+
+    @property
+    def expression(self) -> Optional[ds.Expression]:
+        return None if self.where is None else self.where.expression
+
+    def filter(self, where: Where) -> "Dataset[Cls]":
+        where = as_predicate(where)
+        if self.where is not None:
+            where = self.where & where
+        return Dataset(self.model, self.dataset, where)
+
+    def fragments(self) -> Iterator[ds.Fragment]:
+        # partitions which cannot match the filter are pruned here
+        if self.where is None:
+            return self.dataset.get_fragments()
+        return self.dataset.get_fragments(filter=self.expression)
+
+    def scanner(self, columns: Columns = None, **kwargs: Any) -> ds.Scanner:
+        kwargs.setdefault("use_threads", True)
+        return self.dataset.scanner(columns=columns, filter=self.expression, **kwargs)
+
+    def to_batches(self, columns: Columns = None, **kwargs: Any) -> Iterator[pa.RecordBatch]:
+        return self.scanner(columns=columns, **kwargs).to_batches()
+
+    def model_scanner(self, **kwargs: Any) -> ds.Scanner:
+        if kwargs.get("columns") is not None:
+            err = "projected columns are not model typed, use Dataset.scanner or Dataset.to_batches instead"
+            raise DataError(err)
+        return self.scanner(**kwargs)
+
+    def to_table(self, memory_budget: Optional[int] = None, **kwargs: Any) -> "Base[Cls, Any]":
+        scanner = self.model_scanner(**kwargs)
+        if memory_budget is None:
+            return self.model._from_arrow(scanner.to_table())
+        return self.model._from_arrow(collect(scanner.projected_schema, scanner.to_batches(), memory_budget))
+
+    def head(self, num_rows: int, **kwargs: Any) -> "Base[Cls, Any]":
+        return self.model._from_arrow(self.model_scanner(**kwargs).head(num_rows))
+
+    def stream(self, **kwargs: Any) -> "Stream":
+        from tableclasses.base.stream import Stream  # noqa: PLC0415
+
+        return Stream.of(self.model, self.model_scanner(**kwargs).to_batches())
+
+    def count_rows(self, **kwargs: Any) -> int:
+        return self.scanner(**kwargs).count_rows()
+
+    def __repr__(self):
+        return f"Dataset[{self.model.__name__}](where={self.expression})"
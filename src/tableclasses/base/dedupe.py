@@ -0,0 +1,81 @@
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal, Optional, Union
+
+import pyarrow as pa
+
+from tableclasses.base.utils import import_numpy
+from tableclasses.errs import DataError
+
+if TYPE_CHECKING:
+    import numpy as np
+
+Keep = Literal["first", "last"]
+
+
+class SeenHashes:
+    __slots__ = ("hashes",)
+
+    def __init__(self, hashes: Optional["np.ndarray"] = None):
+        np = import_numpy()
+        self.hashes = np.zeros(0, dtype=np.uint64) if hashes is None else np.unique(hashes.astype(np.uint64))
+
+    def __len__(self) -> int:
+        return len(self.hashes)
+
+    def contains(self, hashes: "np.ndarray") -> "np.ndarray":
+        np = import_numpy()
+        if len(self.hashes) == 0:
+            return np.zeros(len(hashes), dtype=bool)
+        # sorted probes walk the history front to back instead of jumping around in it
+        order = np.argsort(hashes)
+        probes = hashes[order]
+        at = np.searchsorted(self.hashes, probes).clip(max=len(self.hashes) - 1)
+        found = np.empty(len(hashes), dtype=bool)
+        found[order] = self.hashes[at] == probes
+        return found
+
+    def add(self, hashes: "np.ndarray"):
+        np = import_numpy()
+        # only the new hashes are placed into the sorted history, which is never sorted again
+        fresh = np.unique(hashes)
+        if len(self.hashes) > 0:
+            at = np.searchsorted(self.hashes, fresh)
+            fresh = fresh[self.hashes[at.clip(max=len(self.hashes) - 1)] != fresh]
+        if len(fresh) > 0:
+            self.hashes = np.insert(self.hashes, np.searchsorted(self.hashes, fresh), fresh)
+
+    def save(self, path: Union[str, Path]):
+        np = import_numpy()
+        with open(path, "wb") as f:
+            np.save(f, self.hashes)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "SeenHashes":
+        np = import_numpy()
+        with open(path, "rb") as f:
+            return cls(np.load(f))
+
+
+def unique_rows(hashes: "np.ndarray", keep: Keep) -> "np.ndarray":
+    np = import_numpy()
+    if keep == "first":
+        _, rows = np.unique(hashes, return_index=True)
+    elif keep == "last":
+        _, rows = np.unique(hashes[::-1], return_index=True)
+        rows = len(hashes) - 1 - rows
+    else:
+        err = f"keep={keep!r} should be first or last"
+        raise DataError(err)
+    return np.sort(rows)
+
+
+def dedupe(table: pa.Table, hashes: "np.ndarray", keep: Keep, seen: Optional[SeenHashes]) -> pa.Table:
+    rows = unique_rows(hashes, keep)
+    if seen is not None:
+        kept = hashes[rows]
+        fresh = ~seen.contains(kept)
+        rows = rows[fresh]
+        seen.add(kept[fresh])
+    if len(rows) == table.num_rows:
+        return table
+    return table.take(pa.array(rows, type=pa.int64()))
@@ -0,0 +1,192 @@
+from collections.abc import Iterable, Iterator
+from typing import Any, Union
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from tableclasses.base.field import FieldMeta
+from tableclasses.errs import DataError
+
+
+class Predicate:
+    __slots__ = ("args", "expression", "op")
+
+    def __init__(self, op: str, args: tuple, expression: pc.Expression):
+        self.op = op
+        self.args = args
+        self.expression = expression
+
+    def __and__(self, other: "Where") -> "Predicate":
+        other = as_predicate(other)
+        return Predicate("and", (self, other), self.expression & other.expression)
+
+    def __rand__(self, other: "Where") -> "Predicate":
+        return as_predicate(other) & self
+
+    def __or__(self, other: "Where") -> "Predicate":
+        other = as_predicate(other)
+        return Predicate("or", (self, other), self.expression | other.expression)
+
+    def __ror__(self, other: "Where") -> "Predicate":
+        return as_predicate(other) | self
+
+    def __invert__(self) -> "Predicate":
+        return Predicate("not", (self,), ~self.expression)
+
+    def __bool__(self):
+        msg = "predicates cannot be used as booleans, combine them with &, | and ~ instead"
+        raise TypeError(msg)
+
+    def __repr__(self):
+        return f"Predicate({self.expression})"
+
+
+Where = Union[Predicate, pc.Expression]
+
+
+def as_predicate(where: Where) -> Predicate:
+    if isinstance(where, Predicate):
+        return where
+    if isinstance(where, pc.Expression):
+        return Predicate("expression", (where,), where)
+    err = f"{where!r} is not a predicate or pyarrow expression"
+    raise DataError(err)
+
+
+def as_expression(where: Where) -> pc.Expression:
+    return as_predicate(where).expression
+
+
+class Column:
+    __slots__ = ("expression", "meta", "name", "type")
+
+    def __init__(self, meta: FieldMeta):
+        self.name = meta.col_name
+        self.meta = meta
+        self.type = meta.arrow_type
+        self.expression = pc.field(meta.col_name)
+
+    def scalar(self, value: Any) -> pa.Scalar:
+        if isinstance(value, pa.Scalar):
+            value = value.as_py()
+        try:
+            return pa.scalar(value, type=self.type)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError, ValueError) as e:
+            err = f"{value!r} is not a valid {self.type} for {self.name}"
+            raise DataError(err) from e
+
+    def _compare(self, op: str, other: Any) -> Predicate:
+        if isinstance(other, Column):
+            rhs = other.expression
+        else:
+            other = self.scalar(other)
+            rhs = pc.scalar(other)
+        return Predicate(op, (self, other), getattr(pc, op)(self.expression, rhs))
+
+    def __eq__(self, other: Any) -> Predicate:  # type: ignore[override]
+        return self._compare("equal", other)
+
+    def __ne__(self, other: Any) -> Predicate:  # type: ignore[override]
+        return self._compare("not_equal", other)
+
+    def __lt__(self, other: Any) -> Predicate:
+        return self._compare("less", other)
+
+    def __le__(self, other: Any) -> Predicate:
+        return self._compare("less_equal", other)
+
+    def __gt__(self, other: Any) -> Predicate:
+        return self._compare("greater", other)
+
+    def __ge__(self, other: Any) -> Predicate:
+        return self._compare("greater_equal", other)
+
+    def __hash__(self):
+        return hash(self.name)
+
+    def between(self, lower: Any, upper: Any) -> Predicate:
+        return (self >= lower) & (self <= upper)
+
+    def isin(self, values: Iterable) -> Predicate:
+        try:
+            value_set = pa.array(list(values), type=self.type)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError, ValueError) as e:
+            err = f"{values!r} are not valid {self.type} values for {self.name}"
+            raise DataError(err) from e
+        return Predicate("is_in", (self, value_set), self.expression.isin(value_set))
+
+    def is_null(self) -> Predicate:
+        return Predicate("is_null", (self,), self.expression.is_null())
+
+    def is_valid(self) -> Predicate:
+        return Predicate("is_valid", (self,), self.expression.is_valid())
+
+    def __repr__(self):
+        return f"Column({self.name}: {self.type})"
+
+
+class Columns:
+    def __init__(self, named: list[tuple[str, FieldMeta]]):
+        columns = {}
+        lookup = {}
+        for name, meta in named:
+            col = Column(meta)
+            columns[meta.col_name] = col
+            for key in (name, meta.col_name, *meta.aliases):
+                lookup.setdefault(key, col)
+        self._columns = columns
+        self._lookup = lookup
+        self._names = {name for name, _ in named} | set(columns)
+
+    def __getattr__(self, name: str) -> Column:
+        col = self._lookup.get(name)
+        if col is None:
+            err = f"{name} is unknown to the model"
+            raise AttributeError(err)
+        return col
+
+    def __getitem__(self, name: Union[str, Column]) -> Column:
+        if isinstance(name, Column):
+            name = name.name
+        col = self._lookup.get(name)
+        if col is None:
+            err = f"{name} is unknown to the model"
+            raise DataError(err)
+        return col
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._lookup
+
+    def __iter__(self) -> Iterator[Column]:
+        return iter(self._columns.values())
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    def __dir__(self):
+        return list(self._lookup)
+
+    def __repr__(self):
+        return "Columns({:})".format(", ".join(self._columns))
+
+
+class ModelColumns:
+    def __init__(self, *, shadowable: bool = False):
+        self.shadowable = shadowable
+
+    def __set_name__(self, owner: type, name: str):
+        self.name = name
+
+    def __get__(self, instance: Any, owner: type) -> Columns:
+        if instance is not None:
+            # defer to the tabular type's own attribute lookup, e.g. a dataframe column named `c`
+            raise AttributeError(self.name)
+        cols = vars(owner).get("__tabled_columns__")
+        if cols is None:
+            cols = Columns([(field.name, FieldMeta(**field.metadata)) for field in owner.__known__])
+            owner.__tabled_columns__ = cols
+        if self.shadowable and self.name in cols._names:
+            # a model field of the same name wins, e.g. when dataclass() looks up field defaults
+            err = f"{owner.__name__}.{self.name} is a model field, use {owner.__name__}.__columns__ instead"
+            raise AttributeError(err)
+        return cols
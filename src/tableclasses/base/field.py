@@ -1,25 +1,61 @@
+import json
 from dataclasses import asdict, dataclass
 from dataclasses import field as _field
-from typing import Optional
+from typing import Any, Optional, Union
+
+from pyarrow import DataType
 
 from tableclasses.types import P, TableType
 
 
 @dataclass
 class FieldMeta:
-    typ: str
+    typ: Union[str, DataType]
     index: bool
     aliases: list[str]
     col_name: Optional[str] = None
     arrow: Optional[TableType] = None
+    ge: Optional[Any] = None
+    le: Optional[Any] = None
+    pattern: Optional[str] = None
+    isin: Optional[list] = None
+    unique: bool = False
+    not_null: bool = False
+    zone_map: bool = False
+    bloom: bool = False
+
+    @property
+    def arrow_type(self):
+        # backends may wrap the arrow type, e.g. pandas.ArrowDtype
+        return getattr(self.arrow, "pyarrow_dtype", self.arrow)
+
+
+MODEL_KEY = b"tableclasses.model"
+INDEX_KEY = b"tableclasses.index"
+ALIASES_KEY = b"tableclasses.aliases"
+
+
+def field_metadata(meta: FieldMeta) -> dict[bytes, bytes]:
+    return {
+        INDEX_KEY: b"true" if meta.index else b"false",
+        ALIASES_KEY: json.dumps(meta.aliases).encode(),
+    }
 
 
 def field(
-    typ: str,
+    typ: Union[str, DataType],
     *args: P.args,
     index: Optional[bool] = False,
     aliases: Optional[list[str]] = None,
     col_name: Optional[str] = None,
+    ge: Optional[Any] = None,
+    le: Optional[Any] = None,
+    pattern: Optional[str] = None,
+    isin: Optional[list] = None,
+    unique: Optional[bool] = False,
+    not_null: Optional[bool] = False,
+    zone_map: Optional[bool] = False,
+    bloom: Optional[bool] = False,
     **kwargs: P.kwargs,
 ):
     meta = kwargs.get("metadata")
@@ -27,6 +63,20 @@ def field(
         meta = {}
     if aliases is None:
         aliases = []
-    modelled = FieldMeta(typ=typ, index=index, col_name=col_name, arrow=None, aliases=aliases)
+    modelled = FieldMeta(
+        typ=typ,
+        index=index,
+        col_name=col_name,
+        arrow=None,
+        aliases=aliases,
+        ge=ge,
+        le=le,
+        pattern=pattern,
+        isin=None if isin is None else list(isin),
+        unique=unique,
+        not_null=not_null,
+        zone_map=zone_map or bloom,
+        bloom=bloom,
+    )
     meta = {**meta, **asdict(modelled)}
     return _field(*args, **kwargs, metadata=meta)
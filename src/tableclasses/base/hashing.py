@@ -0,0 +1,85 @@
+from typing import TYPE_CHECKING
+
+import pyarrow as pa
+
+from tableclasses.base.utils import import_numpy
+from tableclasses.errs import DataError
+
+if TYPE_CHECKING:
+    import numpy as np
+
+FNV_OFFSET = 0xCBF29CE484222325
+FNV_PRIME = 0x100000001B3
+NULL_HASH = 0x9E3779B97F4A7C15
+
+
+def splitmix(x: "np.ndarray") -> "np.ndarray":
+    np = import_numpy()
+    # finalizer of splitmix64, every input bit affects every output bit
+    x = x + np.uint64(0x9E3779B97F4A7C15)
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+
+def hash_bytes(arr: pa.Array) -> "np.ndarray":
+    np = import_numpy()
+    arr = arr.cast(pa.large_binary())
+    n = len(arr)
+    offsets = np.frombuffer(arr.buffers()[1], dtype=np.int64)[arr.offset : arr.offset + n + 1]
+    data = arr.buffers()[2]
+    data = np.zeros(0, dtype=np.uint8) if data is None else np.frombuffer(data, dtype=np.uint8)
+    starts = offsets[:-1]
+    lengths = offsets[1:] - starts
+    hashes = np.full(n, FNV_OFFSET, dtype=np.uint64) ^ lengths.astype(np.uint64)
+    prime = np.uint64(FNV_PRIME)
+    # fnv-1a, one byte position at a time over the values that are still long enough
+    order = np.argsort(-lengths, kind="stable")
+    descending = -lengths[order]
+    for j in range(int(lengths.max(initial=0))):
+        rows = order[: np.searchsorted(descending, -j, side="left")]
+        hashes[rows] = (hashes[rows] ^ data[starts[rows] + j]) * prime
+    return hashes
+
+
+def hash_values(arr: pa.Array) -> "np.ndarray":
+    np = import_numpy()
+    typ = arr.type
+    if pa.types.is_dictionary(typ):
+        return hash_values(arr.dictionary_decode())
+    if pa.types.is_string(typ) or pa.types.is_large_string(typ):
+        return hash_bytes(arr)
+    if pa.types.is_binary(typ) or pa.types.is_large_binary(typ) or pa.types.is_fixed_size_binary(typ):
+        return hash_bytes(arr)
+    if pa.types.is_decimal(typ):
+        return hash_bytes(arr.cast(pa.string()))
+    if pa.types.is_floating(typ):
+        values = arr.cast(pa.float64()).fill_null(0.0).to_numpy(zero_copy_only=False)
+        # -0.0 and 0.0 are equal, so they hash the same
+        values = np.where(values == 0.0, 0.0, values)
+        return values.view(np.uint64)
+    if pa.types.is_boolean(typ):
+        return arr.cast(pa.uint8()).fill_null(0).to_numpy(zero_copy_only=False).astype(np.uint64)
+    if typ.num_fields == 0 and typ.bit_width in (8, 16, 32, 64):
+        as_int = arr.view(getattr(pa, f"int{typ.bit_width}")()).cast(pa.int64())
+        return as_int.fill_null(0).to_numpy(zero_copy_only=False).view(np.uint64)
+    err = f"({typ}) values cannot be hashed"
+    raise DataError(err)
+
+
+def hash_array(arr: pa.Array) -> "np.ndarray":
+    if isinstance(arr, pa.ChunkedArray):
+        arr = arr.combine_chunks()
+    hashes = splitmix(hash_values(arr))
+    if arr.null_count > 0:
+        hashes[arr.is_null().to_numpy(zero_copy_only=False)] = NULL_HASH
+    return hashes
+
+
+def hash_rows(table: pa.Table, names: list[str]) -> "np.ndarray":
+    np = import_numpy()
+    # column hashes are folded in field order, so the same key always hashes the same way
+    hashes = np.full(table.num_rows, FNV_OFFSET, dtype=np.uint64)
+    for name in names:
+        hashes = splitmix((hashes * np.uint64(FNV_PRIME)) ^ hash_array(table.column(name)))
+    return hashes
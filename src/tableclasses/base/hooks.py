@@ -0,0 +1,108 @@
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Callable, Optional, Union
+from weakref import WeakKeyDictionary
+
+
+@dataclass(frozen=True)
+class Event:
+    model: str
+    constructor: str
+    phases: dict[str, float]
+    rows: int
+    input_bytes: int
+    output_bytes: int
+    casts: int
+
+
+Hook = Callable[[Event], None]
+
+registry: list[Hook] = []
+by_model: "WeakKeyDictionary[type, list[Hook]]" = WeakKeyDictionary()
+
+
+def add_hook(hook: Hook, model: Optional[type] = None):
+    if model is None:
+        registry.append(hook)
+    else:
+        by_model.setdefault(model, []).append(hook)
+
+
+def remove_hook(hook: Hook, model: Optional[type] = None):
+    hooks = registry if model is None else by_model.get(model, [])
+    if hook in hooks:
+        hooks.remove(hook)
+    if model is not None and len(hooks) == 0:
+        by_model.pop(model, None)
+
+
+class Recorder:
+    __slots__ = ("casts", "constructor", "hooks", "input_bytes", "last", "model", "phases")
+
+    def __init__(self, model: type, constructor: str, hooks: list[Hook], input_bytes: int):
+        self.model = model
+        self.constructor = constructor
+        self.hooks = hooks
+        self.input_bytes = input_bytes
+        self.casts = 0
+        self.phases = {}
+        self.last = perf_counter()
+
+    def mark(self, phase: str):
+        now = perf_counter()
+        self.phases[phase] = self.phases.get(phase, 0.0) + now - self.last
+        self.last = now
+
+    def cast(self):
+        self.casts += 1
+
+    def emit(self, rows: int, output_bytes: int):
+        event = Event(
+            self.model.__name__,
+            self.constructor,
+            self.phases,
+            rows,
+            self.input_bytes,
+            output_bytes,
+            self.casts,
+        )
+        for hook in self.hooks:
+            hook(event)
+
+
+class NullRecorder:
+    __slots__ = ()
+
+    def mark(self, phase: str):
+        pass
+
+    def cast(self):
+        pass
+
+    def emit(self, rows: int, output_bytes: int):
+        pass
+
+
+NULL = NullRecorder()
+
+
+def recorder(model: type, constructor: str, given: Optional[any] = None) -> Union[Recorder, NullRecorder]:
+    # nothing is timed or measured unless a hook is registered
+    if not registry and not by_model:
+        return NULL
+    hooks = registry + by_model.get(model, [])
+    if len(hooks) == 0:
+        return NULL
+    return Recorder(model, constructor, hooks, nbytes(given))
+
+
+def nbytes(given: any) -> int:
+    if isinstance(given, dict):
+        return sum(nbytes(col) for col in given.values())
+    size = getattr(given, "nbytes", None)
+    if isinstance(size, int):
+        return size
+    usage = getattr(given, "memory_usage", None)
+    if callable(usage):
+        return int(usage(index=True).sum())
+    return 0
@@ -0,0 +1,71 @@
+from typing import TYPE_CHECKING, Any
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from tableclasses.base.utils import import_numpy
+from tableclasses.errs import DataError
+
+if TYPE_CHECKING:
+    import numpy as np
+
+ORDERS = ("C", "F")
+
+
+def numeric(typ: pa.DataType) -> bool:
+    return pa.types.is_integer(typ) or pa.types.is_floating(typ) or pa.types.is_boolean(typ)
+
+
+def matrix_plan(schema: pa.Schema, names: tuple[str, ...]) -> list[int]:
+    positions = []
+    for name in names:
+        pos = schema.get_field_index(name)
+        if not numeric(schema.field(pos).type):
+            err = f"({name}) is not numeric ({schema.field(pos).type})"
+            raise DataError(err)
+        positions.append(pos)
+    return positions
+
+
+def chunk_values(chunk: pa.Array, dtype: "np.dtype", name: str) -> "np.ndarray":
+    np = import_numpy()
+    if chunk.null_count == 0:
+        # a view of the arrow buffer, except for bit packed booleans
+        return chunk.to_numpy(zero_copy_only=not pa.types.is_boolean(chunk.type))
+    if dtype.kind != "f":
+        err = f"({name}) has nulls, which a {dtype} matrix cannot hold"
+        raise DataError(err)
+    return pc.fill_null(chunk.cast(pa.float64()), np.nan).to_numpy()
+
+
+def zero_copy(col: pa.ChunkedArray, dtype: "np.dtype") -> bool:
+    np = import_numpy()
+    return (
+        col.num_chunks == 1
+        and col.null_count == 0
+        and not pa.types.is_boolean(col.type)
+        and np.dtype(col.type.to_pandas_dtype()) == dtype
+    )
+
+
+def to_matrix(table: pa.Table, positions: list[int], dtype: Any, order: str, copy: bool) -> "np.ndarray":
+    np = import_numpy()
+    if order not in ORDERS:
+        err = f"order={order!r} should be C or F"
+        raise DataError(err)
+    dtype = np.dtype(dtype)
+    if not copy and len(positions) == 1 and zero_copy(table.column(positions[0]), dtype):
+        # a read-only view of the arrow buffer
+        return table.column(positions[0]).chunk(0).to_numpy().reshape(-1, 1)
+    out = np.empty((table.num_rows, len(positions)), dtype=dtype, order=order)
+    for j, pos in enumerate(positions):
+        name = table.schema.field(pos).name
+        offset = 0
+        for chunk in table.column(pos).chunks:
+            try:
+                np.copyto(out[offset : offset + len(chunk), j], chunk_values(chunk, dtype, name), casting="same_kind")
+            except TypeError as e:
+                err = f"({name}) cannot be cast to {dtype} without loss"
+                raise DataError(err) from e
+            offset += len(chunk)
+    return out
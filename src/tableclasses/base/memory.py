@@ -0,0 +1,93 @@
+from typing import Optional
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+INTS = (pa.int8(), pa.int16(), pa.int32(), pa.int64())
+UINTS = (pa.uint8(), pa.uint16(), pa.uint32(), pa.uint64())
+
+# strings are only dictionary encoded when at most this share of the values are distinct
+DICTIONARY_RATIO = 0.5
+
+
+def bounds(typ: pa.DataType) -> tuple[int, int]:
+    if pa.types.is_signed_integer(typ):
+        return -(1 << (typ.bit_width - 1)), (1 << (typ.bit_width - 1)) - 1
+    return 0, (1 << typ.bit_width) - 1
+
+
+def narrow_int(col: pa.ChunkedArray) -> Optional[pa.DataType]:
+    lo, hi = pc.min_max(col).values()
+    if not lo.is_valid:
+        return None
+    candidates = INTS if pa.types.is_signed_integer(col.type) else UINTS
+    for typ in candidates:
+        if typ.bit_width >= col.type.bit_width:
+            return None
+        low, high = bounds(typ)
+        if low <= lo.as_py() and hi.as_py() <= high:
+            return typ
+    return None
+
+
+def narrow_float(col: pa.ChunkedArray) -> Optional[pa.DataType]:
+    if col.type != pa.float64() or col.null_count == len(col):
+        return None
+    # only when every value survives the round trip through float32 unchanged
+    narrowed = col.cast(pa.float32()).cast(pa.float64())
+    same = pc.or_(pc.equal(narrowed, col), pc.and_(pc.is_nan(col), pc.is_nan(narrowed)))
+    if pc.all(pc.fill_null(same, True)).as_py():
+        return pa.float32()
+    return None
+
+
+def dictionary(col: pa.ChunkedArray, distinct: int) -> Optional[pa.DataType]:
+    if len(col) == 0 or distinct > len(col) * DICTIONARY_RATIO:
+        return None
+    for typ in INTS:
+        if distinct <= bounds(typ)[1]:
+            return pa.dictionary(typ, col.type)
+    return None
+
+
+def suggest(col: pa.ChunkedArray, distinct: int) -> Optional[pa.DataType]:
+    typ = col.type
+    if pa.types.is_integer(typ):
+        return narrow_int(col)
+    if pa.types.is_floating(typ):
+        return narrow_float(col)
+    if pa.types.is_string(typ) or pa.types.is_large_string(typ) or pa.types.is_binary(typ):
+        return dictionary(col, distinct)
+    return None
+
+
+def suggestions(table: pa.Table) -> dict[str, pa.DataType]:
+    suggested = {}
+    for name, col in zip(table.column_names, table.columns):
+        typ = suggest(col, pc.count_distinct(col, mode="all").as_py())
+        if typ is not None:
+            suggested[name] = typ
+    return suggested
+
+
+def memory_report(table: pa.Table) -> pa.Table:
+    names, types, sizes, nulls, distincts, suggested = [], [], [], [], [], []
+    for name, col in zip(table.column_names, table.columns):
+        distinct = pc.count_distinct(col, mode="all").as_py()
+        typ = suggest(col, distinct)
+        names.append(name)
+        types.append(str(col.type))
+        sizes.append(col.nbytes)
+        nulls.append(col.null_count)
+        distincts.append(distinct)
+        suggested.append(None if typ is None else str(typ))
+    return pa.table(
+        {
+            "column": pa.array(names, pa.string()),
+            "type": pa.array(types, pa.string()),
+            "bytes": pa.array(sizes, pa.int64()),
+            "null_count": pa.array(nulls, pa.int64()),
+            "cardinality": pa.array(distincts, pa.int64()),
+            "suggested": pa.array(suggested, pa.string()),
+        }
+    )
@@ -0,0 +1,88 @@
+from dataclasses import dataclass
+from typing import Generic, Optional, TypeVar
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from tableclasses.errs import DataError
+
+T = TypeVar("T")
+
+LEFT = "__tableclasses_left__"
+RIGHT = "__tableclasses_right__"
+
+
+@dataclass(frozen=True)
+class Changes(Generic[T]):
+    table: T
+    inserted: int
+    updated: int
+    deleted: int
+    removed: Optional[T] = None
+
+
+def positions(num_rows: int) -> pa.Array:
+    arange = getattr(pa, "arange", None)
+    if arange is not None:
+        return arange(0, num_rows)
+    # older pyarrow has no arange, a running sum of ones still avoids a python range
+    return pc.subtract(pc.cumulative_sum(pa.repeat(pa.scalar(1, pa.int64()), num_rows)), 1)
+
+
+def keyed(table: pa.Table, keys: list[str], position: str) -> pa.Table:
+    return table.select(keys).append_column(position, positions(table.num_rows))
+
+
+def check_keys(table: pa.Table, keys: list[str]):
+    if len(keys) == 0:
+        err = "keyed merges need at least one index=True field"
+        raise DataError(err)
+    counts = pa.TableGroupBy(table.select(keys), keys).aggregate([([], "count_all")])
+    if pc.any(pc.greater(counts.column("count_all"), 1)).as_py():
+        err = "({:}) contains duplicate keys".format(",".join(keys))
+        raise DataError(err)
+
+
+def matches(left: pa.Table, right: pa.Table, keys: list[str]) -> tuple[pa.Array, pa.Array]:
+    # the right side is the hash table, so callers put the smaller table there
+    pairs = keyed(left, keys, LEFT).join(keyed(right, keys, RIGHT), keys, join_type="inner", use_threads=True)
+    return pairs.column(LEFT).combine_chunks(), pairs.column(RIGHT).combine_chunks()
+
+
+def unmatched(table: pa.Table, matched: pa.Array) -> pa.Array:
+    rows = positions(table.num_rows)
+    return rows.filter(pc.invert(pc.is_in(rows, value_set=matched)))
+
+
+def upsert(base: pa.Table, delta: pa.Table, keys: list[str]) -> tuple[pa.Table, int, int]:
+    check_keys(delta, keys)
+    replaced, hits = matches(base, delta, keys)
+    kept = base if len(replaced) == 0 else base.take(unmatched(base, replaced))
+    merged = pa.concat_tables([kept, delta])
+    # base keys are not checked, every base row of a duplicated key is replaced by the one delta row
+    updated = pc.count_distinct(hits).as_py()
+    return merged, delta.num_rows - updated, updated
+
+
+def changed(old: pa.Table, new: pa.Table) -> pa.Array:
+    differs = None
+    for name in old.column_names:
+        before, after = old.column(name), new.column(name)
+        nulls = pc.xor(pc.is_null(before), pc.is_null(after))
+        unequal = pc.or_(nulls, pc.fill_null(pc.not_equal(before, after), False))
+        differs = unequal if differs is None else pc.or_(differs, unequal)
+    if differs is None:
+        return pa.array([False] * old.num_rows)
+    return differs.combine_chunks()
+
+
+def diff(old: pa.Table, new: pa.Table, keys: list[str]) -> tuple[pa.Table, pa.Table, int, int, int]:
+    check_keys(old, keys)
+    check_keys(new, keys)
+    before, after = matches(old, new, keys)
+    values = [name for name in old.column_names if name not in keys]
+    updated = after.filter(changed(old.select(values).take(before), new.select(values).take(after)))
+    inserted = unmatched(new, after)
+    deleted = unmatched(old, before)
+    table = new.take(pa.concat_arrays([inserted, updated]))
+    return table, old.take(deleted), len(inserted), len(updated), len(deleted)
@@ -0,0 +1,101 @@
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.json as pj
+
+from tableclasses.base.field import FieldMeta
+from tableclasses.base.sketches import remember
+from tableclasses.base.spill import collect
+from tableclasses.errs import DataError
+
+if TYPE_CHECKING:
+    from tableclasses.base.tabled import Base
+
+
+def parse_type(typ: pa.DataType) -> pa.DataType:
+    # the json reader only converts a subset of types, the rest are read as their json form and cast
+    if pa.types.is_date(typ) or pa.types.is_time(typ):
+        return pa.string()
+    if pa.types.is_dictionary(typ):
+        return parse_type(typ.value_type)
+    if pa.types.is_duration(typ):
+        return pa.int64()
+    return typ
+
+
+def cast_parsed(col: pa.ChunkedArray, typ: pa.DataType) -> pa.ChunkedArray:
+    if col.type == typ:
+        return col
+    if pa.types.is_time(typ):
+        stamped = pc.binary_join_element_wise("1970-01-01T", col, "")
+        return stamped.cast(pa.timestamp(typ.unit)).cast(typ)
+    return col.cast(typ)
+
+
+def read_schema(model: "type[Base]") -> pa.Schema:
+    fields = []
+    for field in model.__known__:
+        meta = FieldMeta(**field.metadata)
+        typ = parse_type(meta.arrow_type)
+        fields += [pa.field(name, typ) for name in (meta.col_name, *meta.aliases)]
+    return pa.schema(fields)
+
+
+def as_model(model: "type[Base]", table: pa.Table) -> pa.Table:
+    cols = []
+    for field in model.__known__:
+        meta = FieldMeta(**field.metadata)
+        given = [table.column(name) for name in (meta.col_name, *meta.aliases)]
+        col = given[0] if len(given) == 1 else pc.coalesce(*given)
+        try:
+            cols.append(cast_parsed(col, meta.arrow_type))
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as e:
+            err = f"({meta.col_name}) cannot be read as {meta.arrow_type}"
+            raise DataError(err) from e
+    return pa.Table.from_arrays(cols, schema=model.arrow_schema())
+
+
+def parsed_batches(reader: pa.RecordBatchReader) -> Iterator[pa.RecordBatch]:
+    while True:
+        try:
+            yield reader.read_next_batch()
+        except StopIteration:
+            return
+        except pa.ArrowInvalid as e:
+            raise DataError(str(e)) from e
+
+
+def read_batches(model: "type[Base]", reader: pa.RecordBatchReader) -> Iterator[Any]:
+    for batch in parsed_batches(reader):
+        yield model._from_arrow(as_model(model, pa.Table.from_batches([batch])))
+
+
+def read_json(
+    model: "type[Base]",
+    source: Any,
+    block_size: Optional[int],
+    stream: bool,
+    *,
+    memory_budget: Optional[int] = None,
+    stats: Union[bool, list, None] = None,
+) -> Union[Any, Iterator[Any]]:
+    read_options = pj.ReadOptions() if block_size is None else pj.ReadOptions(block_size=block_size)
+    parse_options = pj.ParseOptions(explicit_schema=read_schema(model), unexpected_field_behavior="error")
+    try:
+        if stream or memory_budget is not None:
+            reader = pj.open_json(source, read_options=read_options, parse_options=parse_options)
+        else:
+            table = pj.read_json(source, read_options=read_options, parse_options=parse_options)
+    except pa.ArrowInvalid as e:
+        raise DataError(str(e)) from e
+    if stream:
+        return read_batches(model, reader)
+    if memory_budget is not None:
+        table = collect(reader.schema, parsed_batches(reader), memory_budget)
+    table = as_model(model, table)
+    collected = model.collect_stats(stats)
+    if collected is None:
+        return model._from_arrow(table)
+    return remember(model._from_arrow(table), collected.update(table))
@@ -0,0 +1,125 @@
+from collections.abc import Generator
+from dataclasses import dataclass
+from typing import Any, Generic, Optional, TypeVar, Union
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from tableclasses.base.constraints import Check, violations
+from tableclasses.base.merge import positions
+from tableclasses.errs import DataError
+
+T = TypeVar("T")
+
+ERRORS = ("raise", "quarantine")
+CAST_ERRORS = (pa.ArrowInvalid, pa.ArrowTypeError, TypeError, ValueError, OverflowError)
+
+REJECTED = pa.schema([("row", pa.int64()), ("column", pa.string()), ("reason", pa.string())])
+
+
+@dataclass(frozen=True)
+class Quarantined(Generic[T]):
+    table: T
+    rejected: pa.Table
+
+
+class Rejections:
+    def __init__(self):
+        self.rows = []
+        self.columns = []
+        self.reasons = []
+
+    def add(self, rows: Union[int, pa.Array], column: Optional[str], reason: str):
+        rows = [rows] if isinstance(rows, int) else rows.to_pylist()
+        self.rows += rows
+        self.columns += [column] * len(rows)
+        self.reasons += [reason] * len(rows)
+
+    def valid(self, num_rows: int) -> pa.BooleanArray:
+        return pc.invert(at_rows(num_rows, self.rows))
+
+    def to_table(self) -> pa.Table:
+        table = pa.Table.from_arrays(
+            [pa.array(self.rows, type=pa.int64()), pa.array(self.columns, type=pa.string()), pa.array(self.reasons)],
+            schema=REJECTED,
+        )
+        return table.take(pc.sort_indices(table, [("row", "ascending")]))
+
+
+def at_rows(num_rows: int, rows: list[int]) -> pa.BooleanArray:
+    return pc.is_in(positions(num_rows), value_set=pa.array(rows, type=pa.int64()))
+
+
+def flat(arr: Union[pa.Array, pa.ChunkedArray]) -> pa.Array:
+    return arr.combine_chunks() if isinstance(arr, pa.ChunkedArray) else arr
+
+
+def rejections(errors: str) -> Optional[Rejections]:
+    if errors not in ERRORS:
+        err = f"errors={errors!r} should be raise or quarantine"
+        raise DataError(err)
+    return Rejections() if errors == "quarantine" else None
+
+
+def convert(col: Any, typ: pa.DataType) -> Union[pa.Array, pa.ChunkedArray]:
+    if isinstance(col, (pa.Array, pa.ChunkedArray)):
+        # safe casts fail on overflow and truncation instead of wrapping around
+        return col if col.type == typ else col.cast(typ)
+    return pa.array(col, type=typ, from_pandas=True)
+
+
+def part(col: Any, start: int, stop: int) -> Any:
+    return col.iloc[start:stop] if hasattr(col, "iloc") else col[start:stop]
+
+
+def bad_cells(col: Any, typ: pa.DataType, offset: int = 0) -> list[tuple[int, str]]:
+    # halves the failing conversion until the single cells that break it are left
+    try:
+        convert(col, typ)
+    except CAST_ERRORS as e:
+        if len(col) == 1:
+            return [(offset, str(e))]
+        mid = len(col) // 2
+        return bad_cells(part(col, 0, mid), typ, offset) + bad_cells(part(col, mid, len(col)), typ, offset + mid)
+    return []
+
+
+def safe_column(col: Any, typ: pa.DataType) -> tuple[Union[pa.Array, pa.ChunkedArray], list[tuple[int, str]]]:
+    if isinstance(col, Generator):
+        col = list(col)
+    try:
+        return convert(col, typ), []
+    except CAST_ERRORS:
+        bad = bad_cells(col, typ)
+    rows = [row for row, _ in bad]
+    if isinstance(col, (pa.Array, pa.ChunkedArray)):
+        col = pc.if_else(at_rows(len(col), rows), pa.scalar(None, col.type), flat(col))
+    else:
+        col = list(col)
+        for row in rows:
+            col[row] = None
+    return convert(col, typ), bad
+
+
+def quarantine(
+    cols: list[Any],
+    schema: pa.Schema,
+    constraints: list[tuple[str, list[tuple[str, Check]]]],
+    rejected: Rejections,
+) -> pa.Table:
+    arrays = []
+    for col, field in zip(cols, schema):
+        arr, bad = safe_column(col, field.type)
+        for row, reason in bad:
+            rejected.add(row, field.name, reason)
+        arrays.append(arr)
+    table = pa.Table.from_arrays(arrays, schema=schema)
+    # constraints only see the rows that survived the casts, so a bad cell is reported once
+    kept = pc.indices_nonzero(rejected.valid(table.num_rows))
+    table = table.take(kept)
+    failed = None
+    for name, constraint, mask in violations(table, constraints):
+        violated = flat(mask)
+        rejected.add(kept.filter(violated), name, f"violates {constraint}")
+        failed = violated if failed is None else pc.or_(failed, violated)
+    return table if failed is None else table.filter(pc.invert(failed))
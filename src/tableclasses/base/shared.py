@@ -0,0 +1,53 @@
+import sys
+from ctypes import addressof, c_char
+from dataclasses import dataclass
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+import pyarrow as pa
+
+
+@dataclass(frozen=True)
+class SharedTable:
+    name: str
+    size: int
+
+    def unlink(self):
+        shm = SharedMemory(self.name)
+        shm.close()
+        shm.unlink()
+
+
+def attach(name: str) -> SharedMemory:
+    # only the creating process owns the segment, readers must not unlink it when they exit
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name, track=False)
+    shm = SharedMemory(name)
+    resource_tracker.unregister(shm._name, "shared_memory")
+    return shm
+
+
+def write_stream(sink, table: pa.Table):
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+
+
+def to_shared(table: pa.Table) -> SharedTable:
+    mock = pa.MockOutputStream()
+    write_stream(mock, table)
+    size = mock.size()
+    shm = SharedMemory(create=True, size=max(size, 1))
+    view = pa.py_buffer(shm.buf)
+    write_stream(pa.FixedSizeBufferWriter(view), table)
+    # the exported view has to be released before the mapping can be closed
+    del view
+    shm.close()
+    return SharedTable(shm.name, size)
+
+
+def from_shared(handle: SharedTable) -> pa.Table:
+    shm = attach(handle.name)
+    # the arrow buffers point into the mapping, which stays open for as long as they are alive
+    address = addressof(c_char.from_buffer(shm.buf))
+    buf = pa.foreign_buffer(address, handle.size, base=shm)
+    return pa.ipc.open_stream(buf).read_all()
@@ -0,0 +1,219 @@
+import math
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Any, Optional, Union
+from weakref import finalize
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from tableclasses.base.hashing import hash_array
+from tableclasses.base.utils import import_numpy
+
+if TYPE_CHECKING:
+    import numpy as np
+
+HLL_PRECISION = 12
+DIGEST_COMPRESSION = 100
+
+
+def bit_length(x: "np.ndarray") -> "np.ndarray":
+    np = import_numpy()
+    length = np.zeros(len(x), dtype=np.uint64)
+    for shift in (32, 16, 8, 4, 2, 1):
+        wide = (x >> np.uint64(shift)) != 0
+        length[wide] += np.uint64(shift)
+        x = np.where(wide, x >> np.uint64(shift), x)
+    return length + (x != 0)
+
+
+class HyperLogLog:
+    __slots__ = ("precision", "registers")
+
+    def __init__(self, precision: int = HLL_PRECISION, registers: Optional["np.ndarray"] = None):
+        np = import_numpy()
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8) if registers is None else registers
+
+    def update(self, hashes: "np.ndarray"):
+        np = import_numpy()
+        if len(hashes) == 0:
+            return
+        rest = 64 - self.precision
+        index = (hashes >> np.uint64(rest)).astype(np.intp)
+        tail = hashes & np.uint64((1 << rest) - 1)
+        rank = (np.uint64(rest + 1) - bit_length(tail)).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        np = import_numpy()
+        return HyperLogLog(self.precision, np.maximum(self.registers, other.registers))
+
+    def estimate(self) -> int:
+        np = import_numpy()
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        # linear counting is more accurate while many registers are still empty
+        if raw <= 2.5 * m and zeros > 0:
+            return round(m * math.log(m / zeros))
+        return round(raw)
+
+
+class TDigest:
+    __slots__ = ("compression", "means", "weights")
+
+    def __init__(
+        self,
+        compression: int = DIGEST_COMPRESSION,
+        means: Optional["np.ndarray"] = None,
+        weights: Optional["np.ndarray"] = None,
+    ):
+        np = import_numpy()
+        self.compression = compression
+        self.means = np.zeros(0) if means is None else means
+        self.weights = np.zeros(0) if weights is None else weights
+
+    def compress(self, means: "np.ndarray", weights: "np.ndarray"):
+        np = import_numpy()
+        order = np.argsort(means, kind="stable")
+        means, weights = means[order], weights[order]
+        total = weights.sum()
+        if total == 0:
+            return
+        # centroids are grouped by whole steps of the k1 scale function, small at the tails and wide in the middle
+        q = (np.cumsum(weights) - weights / 2) / total
+        k = self.compression / (2 * math.pi) * np.arcsin(np.clip(2 * q - 1, -1, 1))
+        group = np.floor(k - k[0]).astype(np.int64)
+        starts = np.flatnonzero(np.r_[True, group[1:] != group[:-1]])
+        merged = np.add.reduceat(weights, starts)
+        self.means = np.add.reduceat(means * weights, starts) / merged
+        self.weights = merged
+
+    def update(self, values: "np.ndarray"):
+        np = import_numpy()
+        values = values[~np.isnan(values)]
+        if len(values) > 0:
+            self.compress(np.r_[self.means, values], np.r_[self.weights, np.ones(len(values))])
+
+    def merge(self, other: "TDigest") -> "TDigest":
+        np = import_numpy()
+        merged = TDigest(self.compression)
+        merged.compress(np.r_[self.means, other.means], np.r_[self.weights, other.weights])
+        return merged
+
+    def quantile(self, q: float) -> Optional[float]:
+        np = import_numpy()
+        if len(self.means) == 0:
+            return None
+        centers = (np.cumsum(self.weights) - self.weights / 2) / self.weights.sum()
+        return float(np.interp(q, centers, self.means))
+
+
+class FieldStats:
+    __slots__ = ("count", "digest", "distinct", "max", "min", "nulls")
+
+    def __init__(self, digest: bool):
+        self.count = 0
+        self.nulls = 0
+        self.min = None
+        self.max = None
+        self.distinct = HyperLogLog()
+        self.digest = TDigest() if digest else None
+
+    def update(self, col: Union[pa.Array, pa.ChunkedArray]):
+        self.count += len(col)
+        self.nulls += col.null_count
+        if pa.types.is_dictionary(col.type):
+            col = col.cast(col.type.value_type)
+        lo, hi = pc.min_max(col).values()
+        self.min = bound(min, self.min, lo.as_py())
+        self.max = bound(max, self.max, hi.as_py())
+        valid = col.drop_null()
+        self.distinct.update(hash_array(valid))
+        if self.digest is not None:
+            self.digest.update(valid.cast(pa.float64()).to_numpy())
+
+    def merge(self, other: "FieldStats") -> "FieldStats":
+        merged = FieldStats(digest=False)
+        merged.count = self.count + other.count
+        merged.nulls = self.nulls + other.nulls
+        merged.min = bound(min, self.min, other.min)
+        merged.max = bound(max, self.max, other.max)
+        merged.distinct = self.distinct.merge(other.distinct)
+        if self.digest is not None and other.digest is not None:
+            merged.digest = self.digest.merge(other.digest)
+        return merged
+
+    def quantile(self, q: float) -> Optional[float]:
+        return None if self.digest is None else self.digest.quantile(q)
+
+    def approx_distinct(self) -> int:
+        return self.distinct.estimate()
+
+    def __repr__(self):
+        return (
+            f"FieldStats(count={self.count}, nulls={self.nulls}, min={self.min!r}, max={self.max!r}, "
+            f"distinct~{self.approx_distinct()})"
+        )
+
+
+def bound(pick: Any, current: Any, value: Any) -> Any:
+    if current is None:
+        return value
+    if value is None:
+        return current
+    return pick(current, value)
+
+
+class TableStats:
+    def __init__(self, fields: dict[str, FieldStats]):
+        self.fields = fields
+
+    @classmethod
+    def of(cls, schema: pa.Schema, names: Iterable[str]) -> "TableStats":
+        fields = {}
+        for name in names:
+            typ = schema.field(name).type
+            if pa.types.is_nested(typ):
+                continue
+            fields[name] = FieldStats(digest=pa.types.is_integer(typ) or pa.types.is_floating(typ))
+        return cls(fields)
+
+    def update(self, table: Union[pa.Table, pa.RecordBatch]) -> "TableStats":
+        for name, stats in self.fields.items():
+            stats.update(table.column(name))
+        return self
+
+    def updating(self, batches: Iterable[pa.RecordBatch]) -> Iterator[pa.RecordBatch]:
+        for batch in batches:
+            self.update(batch)
+            yield batch
+
+    def merge(self, other: "TableStats") -> "TableStats":
+        return TableStats({name: stats.merge(other.fields[name]) for name, stats in self.fields.items()})
+
+    def __getitem__(self, name: str) -> FieldStats:
+        return self.fields[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.fields)
+
+    def __repr__(self):
+        return f"TableStats({', '.join(self.fields)})"
+
+
+stats_cache: dict[int, TableStats] = {}
+
+
+def remember(result: Any, stats: TableStats) -> Any:
+    # kept next to the result object for as long as it is alive
+    key = id(result)
+    if key not in stats_cache:
+        finalize(result, stats_cache.pop, key, None)
+    stats_cache[key] = stats
+    return result
+
+
+def recall(result: Any) -> Optional[TableStats]:
+    return stats_cache.get(id(result))
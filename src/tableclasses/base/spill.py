@@ -0,0 +1,76 @@
+import os
+from collections import deque
+from collections.abc import Iterable
+from tempfile import mkstemp
+from typing import Optional
+
+import pyarrow as pa
+
+
+class Spill:
+    def __init__(self, schema: pa.Schema, budget: int, directory: Optional[str] = None):
+        self.schema = schema
+        self.budget = budget
+        self.directory = directory
+        self.held = deque()
+        self.size = 0
+        self.path = None
+        self.sink = None
+        self.writer = None
+
+    def spill(self):
+        if self.writer is None:
+            fd, self.path = mkstemp(suffix=".arrow", dir=self.directory)
+            os.close(fd)
+            self.sink = pa.OSFile(self.path, "wb")
+            self.writer = pa.ipc.new_file(self.sink, self.schema)
+        # the oldest batches go first, so the file always holds a prefix of the table
+        while self.size > self.budget and len(self.held) > 0:
+            batch = self.held.popleft()
+            self.size -= batch.nbytes
+            self.writer.write_batch(batch)
+
+    def append(self, batch: pa.RecordBatch):
+        self.held.append(batch)
+        self.size += batch.nbytes
+        if self.size > self.budget:
+            self.spill()
+
+    def extend(self, batches: Iterable[pa.RecordBatch]) -> "Spill":
+        for batch in batches:
+            self.append(batch)
+        return self
+
+    def discard(self):
+        self.held.clear()
+        if self.writer is not None:
+            self.writer.close()
+            self.sink.close()
+            os.unlink(self.path)
+            self.writer = None
+
+    def finish(self) -> pa.Table:
+        held = pa.Table.from_batches(list(self.held), schema=self.schema)
+        self.held.clear()
+        if self.writer is None:
+            return held
+        self.writer.close()
+        self.sink.close()
+        try:
+            # the mapping keeps the spilled pages readable once the file is unlinked
+            spilled = pa.ipc.open_file(pa.memory_map(self.path)).read_all()
+        finally:
+            os.unlink(self.path)
+        return pa.concat_tables([spilled, held])
+
+
+def collect(schema: pa.Schema, batches: Iterable[pa.RecordBatch], budget: Optional[int]) -> pa.Table:
+    if budget is None:
+        return pa.Table.from_batches(batches, schema=schema)
+    spill = Spill(schema, budget)
+    try:
+        spill.extend(batches)
+    except BaseException:
+        spill.discard()
+        raise
+    return spill.finish()
@@ -0,0 +1,126 @@
+from collections.abc import Iterable, Iterator
+from itertools import chain
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
+
+import pyarrow as pa
+
+from tableclasses.base.field import FieldMeta
+from tableclasses.base.sketches import remember
+from tableclasses.base.spill import collect
+from tableclasses.base.utils import get_table, must_get_col, typed_table
+from tableclasses.errs import DataError
+
+if TYPE_CHECKING:
+    from tableclasses.base.tabled import Base
+
+Batches = Union[pa.RecordBatchReader, Iterable[Union[pa.RecordBatch, pa.Table]]]
+Stats = Union[bool, list, None]
+BatchFn = Callable[[pa.RecordBatch], Union[pa.RecordBatch, pa.Table, None]]
+
+
+def allowed_repr(meta: FieldMeta):
+    return f"pa.Array[{meta.typ}]"
+
+
+def conform(model: "type[Base]", table: pa.Table) -> pa.Table:
+    schema = model.arrow_schema()
+    if table.schema.equals(schema):
+        return model.check_constraints(table)
+    model.validate_allowed(table.column_names)
+    cols = []
+    for field in model.__known__:
+        meta = FieldMeta(**field.metadata)
+        cols.append(must_get_col(get_table, table, meta, allowed_repr))
+    try:
+        typed = typed_table(cols, schema)
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as e:
+        raise DataError(str(e)) from e
+    return model.check_constraints(typed)
+
+
+def flatten(batches: Batches) -> Iterator[pa.RecordBatch]:
+    for batch in batches:
+        if isinstance(batch, pa.Table):
+            yield from batch.to_batches()
+        elif batch is not None:
+            yield batch
+
+
+def conformed(model: "type[Base]", batches: Iterable[pa.RecordBatch]) -> Iterator[pa.RecordBatch]:
+    # each batch is checked and cast on its own, nothing upstream is held on to
+    for batch in batches:
+        yield from conform(model, pa.Table.from_batches([batch])).to_batches()
+
+
+def mapped(fn: BatchFn, batches: Iterable[pa.RecordBatch]) -> Iterator[pa.RecordBatch]:
+    for batch in batches:
+        yield from flatten([fn(batch)])
+
+
+class Stream:
+    def __init__(self, model: Optional["type[Base]"], batches: Iterable[pa.RecordBatch]):
+        self.model = model
+        self.batches = batches
+
+    @classmethod
+    def of(cls, model: "type[Base]", batches: Batches) -> "Stream":
+        return cls(model, conformed(model, flatten(batches)))
+
+    def map_batches(self, fn: BatchFn) -> "Stream":
+        # the output of fn is untyped until it is conformed with into
+        return Stream(None, mapped(fn, self.batches))
+
+    def into(self, model: "type[Base]") -> "Stream":
+        return Stream(model, conformed(model, self.batches))
+
+    @property
+    def schema(self) -> Optional[pa.Schema]:
+        return None if self.model is None else self.model.arrow_schema()
+
+    def to_batches(self) -> Iterator[pa.RecordBatch]:
+        return iter(self.batches)
+
+    def to_reader(self) -> pa.RecordBatchReader:
+        if self.model is None:
+            err = "untyped streams have no schema, call Stream.into first"
+            raise DataError(err)
+        return pa.RecordBatchReader.from_batches(self.schema, self.to_batches())
+
+    def __iter__(self) -> Iterator[Any]:
+        for batch in self.batches:
+            table = pa.Table.from_batches([batch])
+            yield table if self.model is None else self.model._from_arrow(table)
+
+    def to_table(self, memory_budget: Optional[int] = None, stats: Stats = None) -> Any:
+        if self.model is None:
+            if stats:
+                err = "stats need the model of the stream, call Stream.into first"
+                raise DataError(err)
+            batches = iter(self.batches)
+            first = next(batches, None)
+            if first is None:
+                err = "untyped streams have no schema, call Stream.into first"
+                raise DataError(err)
+            return collect(first.schema, chain([first], batches), memory_budget)
+        collected = self.model.collect_stats(stats)
+        batches = self.batches if collected is None else collected.updating(self.batches)
+        result = self.model._from_arrow(collect(self.schema, batches, memory_budget))
+        return result if collected is None else remember(result, collected)
+
+    def write(self, where: Any, fmt: str = "parquet", **kwargs: Any) -> int:
+        reader = self.to_reader()
+        rows = 0
+        if fmt == "parquet":
+            from pyarrow.parquet import ParquetWriter  # noqa: PLC0415
+
+            writer = ParquetWriter(where, reader.schema, **kwargs)
+        elif fmt in ("ipc", "arrow", "feather"):
+            writer = pa.ipc.new_file(where, reader.schema, **kwargs)
+        else:
+            err = f"({fmt}) is not a supported stream format"
+            raise DataError(err)
+        with writer:
+            for batch in reader:
+                writer.write_batch(batch)
+                rows += batch.num_rows
+        return rows
@@ -1,10 +1,38 @@
+from collections.abc import Iterator
 from dataclasses import Field
-from typing import Dict, Generic, List, Optional, Protocol, TypeVar, overload
+from typing import TYPE_CHECKING, Any, Callable, Dict, Generic, List, Optional, Protocol, TypeVar, Union, overload
 
-from tableclasses.base.field import FieldMeta
+from pyarrow import RecordBatchReader as _RecordBatchReader
+from pyarrow import Schema as _Schema
+from pyarrow import Table as _Table
+from pyarrow import UInt64Array as _UInt64Array
+from pyarrow import array as _array
+from pyarrow import field as _field
+from pyarrow import schema as _schema
+from pyarrow import table as _table
+from pyarrow import uint64 as _uint64
+
+from tableclasses.base.agg import COUNT, Aggregations, group_by, resolve_aggregations
+from tableclasses.base.constraints import check_constraints, compile_constraints
+from tableclasses.base.expr import Column, ModelColumns, Where, as_predicate
+from tableclasses.base.field import MODEL_KEY, FieldMeta, field_metadata
+from tableclasses.base.merge import Changes
+from tableclasses.base.merge import diff as diff_tables
+from tableclasses.base.merge import upsert as upsert_tables
+from tableclasses.base.utils import modelmethod
 from tableclasses.errs import DataError
 from tableclasses.types import Cls, ColumnLike, RowsLike, Tabular
 
+if TYPE_CHECKING:
+    import numpy as np
+
+    from tableclasses.base.dataset import Dataset
+    from tableclasses.base.dedupe import SeenHashes
+    from tableclasses.base.quarantine import Rejections
+    from tableclasses.base.shared import SharedTable
+    from tableclasses.base.sketches import TableStats
+    from tableclasses.base.stream import Batches, Stream
+
 
 class Base(
     Protocol,
@@ -14,6 +42,9 @@ class Base(
     ],
 ):
     __known__: List[Field]
+    __derive__: Callable[..., "Base"]
+    __columns__ = ModelColumns()
+    c = ModelColumns(shadowable=True)
 
     @overload
     @classmethod
@@ -32,6 +63,301 @@ class Base(
     ) -> "Base[Cls, Tabular]":  # pragma: no cover
         ...
 
+    @overload
+    @classmethod
+    def _to_arrow(cls, data: Tabular) -> _Table:  # pragma: no cover
+        ...
+
+    @overload
+    @classmethod
+    def _from_arrow(cls, table: _Table) -> "Base[Cls, Tabular]":  # pragma: no cover
+        ...
+
+    @modelmethod
+    def filter(cls, data: Tabular, where: Where) -> "Base[Cls, Tabular]":
+        table = cls._to_arrow(data)
+        where = as_predicate(where)
+        if isinstance(data, _Table) and len(cls.zone_fields()) > 0:
+            from tableclasses.base.zones import prune  # noqa: PLC0415
+
+            table = prune(table, cls.zone_maps(data), where)
+        return cls._from_arrow(table.filter(where.expression))
+
+    @classmethod
+    def row_hash(cls, data: Tabular, fields: Optional[List[Union[str, Column]]] = None) -> _UInt64Array:
+        from tableclasses.base.hashing import hash_rows  # noqa: PLC0415
+
+        return _array(hash_rows(cls._to_arrow(data), cls.key_names(fields)), type=_uint64())
+
+    @classmethod
+    def dedupe(
+        cls,
+        data: Tabular,
+        keep: str = "first",
+        fields: Optional[List[Union[str, Column]]] = None,
+        seen: Optional["SeenHashes"] = None,
+    ) -> "Base[Cls, Tabular]":
+        from tableclasses.base.dedupe import dedupe  # noqa: PLC0415
+        from tableclasses.base.hashing import hash_rows  # noqa: PLC0415
+
+        table = cls._to_arrow(data)
+        return cls._from_arrow(dedupe(table, hash_rows(table, cls.key_names(fields)), keep, seen))
+
+    @classmethod
+    def key_names(cls, fields: Optional[List[Union[str, Column]]] = None) -> List[str]:
+        if fields is not None:
+            return [cls.__columns__[name].name for name in fields]
+        keys = cls.index_fields()
+        return keys if len(keys) > 0 else cls.arrow_schema().names
+
+    @classmethod
+    def to_matrix(
+        cls,
+        data: Tabular,
+        fields: Optional[List[Union[str, Column]]] = None,
+        dtype: Any = "float64",
+        order: str = "F",
+        copy: bool = True,  # noqa: FBT002
+    ) -> "np.ndarray":
+        from tableclasses.base.matrix import matrix_plan, numeric, to_matrix  # noqa: PLC0415
+
+        table = cls._to_arrow(data)
+        if fields is None:
+            names = tuple(f.name for f in cls.arrow_schema() if numeric(f.type))
+        else:
+            names = tuple(cls.__columns__[name].name for name in fields)
+        plans = vars(cls).get("__matrix_plans__")
+        if plans is None:
+            plans = {}
+            cls.__matrix_plans__ = plans
+        key = (names, tuple(table.column_names))
+        positions = plans.get(key)
+        if positions is None:
+            positions = plans[key] = matrix_plan(table.schema, names)
+        return to_matrix(table, positions, dtype, order, copy)
+
+    @classmethod
+    def stats(cls, data: Tabular) -> "TableStats":
+        from tableclasses.base.sketches import TableStats, recall, remember  # noqa: PLC0415
+
+        known = recall(data)
+        if known is None:
+            table = cls._to_arrow(data)
+            known = TableStats.of(table.schema, cls.stats_names(True)).update(table)
+            remember(data, known)
+        return known
+
+    @classmethod
+    def stats_names(cls, stats: Union[bool, List[Union[str, Column]], None]) -> List[str]:
+        if stats is True:
+            return cls.arrow_schema().names
+        if not stats:
+            return []
+        return [cls.__columns__[name].name for name in stats]
+
+    @classmethod
+    def collect_stats(cls, stats: Union[bool, List[Union[str, Column]], None]) -> Optional["TableStats"]:
+        names = cls.stats_names(stats)
+        if len(names) == 0:
+            return None
+        from tableclasses.base.sketches import TableStats  # noqa: PLC0415
+
+        return TableStats.of(cls.arrow_schema(), names)
+
+    @classmethod
+    def lookup(cls, data: Tabular, *key: Any) -> "Base[Cls, Tabular]":
+        index = cls.index_fields()
+        if len(key) != len(index):
+            err = "({:}) need one value each".format(",".join(index))
+            raise DataError(err)
+        where = None
+        for name, value in zip(index, key):
+            equal = cls.__columns__[name] == value
+            where = equal if where is None else where & equal
+        return cls.filter(data, where)
+
+    @classmethod
+    def zone_fields(cls) -> List[tuple[str, bool]]:
+        fields = vars(cls).get("__zone_fields__")
+        if fields is None:
+            fields = []
+            for field in cls.__known__:
+                meta = FieldMeta(**field.metadata)
+                if meta.zone_map:
+                    fields.append((meta.col_name, meta.bloom))
+            cls.__zone_fields__ = fields
+        return fields
+
+    @classmethod
+    def zone_maps(cls, data: _Table) -> list:
+        from tableclasses.base.zones import zone_maps  # noqa: PLC0415
+
+        return zone_maps(cls, data, cls.zone_fields())
+
+    @modelmethod
+    def aggregate(
+        cls,
+        data: Tabular,
+        by: Optional[List[Union[str, Column]]] = None,
+        aggs: Optional[Aggregations] = None,
+    ) -> "Base":
+        table = cls._to_arrow(data)
+        keys = cls.index_fields() if by is None else [cls.__columns__[key].name for key in by]
+        resolved = resolve_aggregations(cls.__columns__, COUNT if aggs is None else aggs)
+        grouped = group_by(table, keys, resolved)
+        specs = tuple((f.name, f.type, f.name in keys) for f in grouped.schema)
+        return cls.__derive__(f"{cls.__name__}Aggregate", specs)._from_arrow(grouped)
+
+    @classmethod
+    def upsert(cls, base: Tabular, delta: Tabular) -> "Changes[Base[Cls, Tabular]]":
+        merged, inserted, updated = upsert_tables(cls._to_arrow(base), cls._to_arrow(delta), cls.index_fields())
+        return Changes(cls._from_arrow(merged), inserted, updated, 0)
+
+    @modelmethod
+    def diff(cls, old: Tabular, new: Tabular) -> "Changes[Base[Cls, Tabular]]":
+        changed, removed, inserted, updated, deleted = diff_tables(
+            cls._to_arrow(old), cls._to_arrow(new), cls.index_fields()
+        )
+        return Changes(cls._from_arrow(changed), inserted, updated, deleted, cls._from_arrow(removed))
+
+    @classmethod
+    def memory_report(cls, data: Tabular) -> _Table:
+        from tableclasses.base.memory import memory_report  # noqa: PLC0415
+
+        return memory_report(cls._to_arrow(data))
+
+    @classmethod
+    def optimize(cls, data: Tabular) -> "Base":
+        from tableclasses.base.memory import suggestions  # noqa: PLC0415
+
+        table = cls._to_arrow(data)
+        suggested = suggestions(table)
+        keys = cls.index_fields()
+        narrowed = _schema([_field(f.name, suggested.get(f.name, f.type)) for f in table.schema])
+        specs = tuple((f.name, f.type, f.name in keys) for f in narrowed)
+        return cls.__derive__(f"{cls.__name__}Optimized", specs)._from_arrow(table.cast(narrowed))
+
+    @classmethod
+    def write_dataset(
+        cls,
+        data: Tabular,
+        root: Any,
+        partition_by: Optional[List[Union[str, Column]]] = None,
+        max_rows_per_file: int = 0,
+        fmt: str = "parquet",
+        **kwargs: Any,
+    ):
+        # pyarrow.dataset pulls in pandas, so it is only imported once datasets are used
+        from pyarrow.dataset import write_dataset  # noqa: PLC0415
+
+        from tableclasses.base.dataset import partitioning  # noqa: PLC0415
+
+        table = cls._to_arrow(data)
+        partition_by = None if partition_by is None else [cls.__columns__[name].name for name in partition_by]
+        if max_rows_per_file > 0:
+            kwargs.setdefault("max_rows_per_group", min(max_rows_per_file, 1 << 20))
+        write_dataset(
+            table,
+            root,
+            format=fmt,
+            partitioning=partitioning(table.schema, partition_by),
+            max_rows_per_file=max_rows_per_file,
+            **kwargs,
+        )
+
+    @classmethod
+    def open_dataset(cls, root: Any, fmt: str = "parquet", **kwargs: Any) -> "Dataset[Cls]":
+        from tableclasses.base.dataset import Dataset, discover  # noqa: PLC0415
+
+        return Dataset(cls, discover(cls, root, fmt, kwargs.pop("partitioning", "hive"), **kwargs))
+
+    @classmethod
+    def stream(cls, data: Union[Tabular, "Batches"], batch_size: Optional[int] = None) -> "Stream":
+        from tableclasses.base.stream import Stream  # noqa: PLC0415
+
+        if not isinstance(data, (_RecordBatchReader, Iterator, list, tuple)):
+            data = cls._to_arrow(data).to_batches(max_chunksize=batch_size)
+        return Stream.of(cls, data)
+
+    @classmethod
+    def read_json(
+        cls,
+        source: Any,
+        block_size: Optional[int] = None,
+        stream: bool = False,  # noqa: FBT002
+        memory_budget: Optional[int] = None,
+        stats: Union[bool, List[Union[str, Column]], None] = None,
+    ) -> Union["Base[Cls, Tabular]", Iterator["Base[Cls, Tabular]"]]:
+        from tableclasses.base.ndjson import read_json  # noqa: PLC0415
+
+        return read_json(cls, source, block_size, stream, memory_budget=memory_budget, stats=stats)
+
+    @classmethod
+    def from_arrow(cls, data: Any) -> "Base[Cls, Tabular]":
+        from tableclasses.base.stream import conform  # noqa: PLC0415
+
+        if not isinstance(data, _Table):
+            if not hasattr(data, "__arrow_c_stream__") and not hasattr(data, "__arrow_c_array__"):
+                err = f"({type(data).__name__}) does not export the arrow c stream or array interface"
+                raise DataError(err)
+            data = _table(data)
+        return cls._from_arrow(conform(cls, data))
+
+    @classmethod
+    def to_shared(cls, data: Tabular) -> "SharedTable":
+        from tableclasses.base.shared import to_shared  # noqa: PLC0415
+
+        return to_shared(cls._to_arrow(data))
+
+    @classmethod
+    def from_shared(cls, handle: "SharedTable") -> "Base[Cls, Tabular]":
+        from tableclasses.base.shared import from_shared  # noqa: PLC0415
+
+        return cls._from_arrow(from_shared(handle))
+
+    @classmethod
+    def arrow_schema(cls) -> _Schema:
+        schema = vars(cls).get("__schema__")
+        if schema is None:
+            fields = []
+            for field in cls.__known__:
+                meta = FieldMeta(**field.metadata)
+                fields.append(_field(meta.col_name, meta.arrow_type, metadata=field_metadata(meta)))
+            # the model travels with the schema, e.g. through the arrow c stream interface
+            schema = _schema(fields, metadata={MODEL_KEY: cls.__qualname__})
+            cls.__schema__ = schema
+        return schema
+
+    @classmethod
+    def constraints(cls) -> list:
+        constraints = vars(cls).get("__constraints__")
+        if constraints is None:
+            constraints = compile_constraints(cls.__known__)
+            cls.__constraints__ = constraints
+        return constraints
+
+    @classmethod
+    def check_constraints(cls, table: _Table) -> _Table:
+        constraints = cls.constraints()
+        if len(constraints) > 0:
+            check_constraints(table, constraints)
+        return table
+
+    @classmethod
+    def quarantine(cls, cols: list, rejected: "Rejections") -> _Table:
+        from tableclasses.base.quarantine import quarantine  # noqa: PLC0415
+
+        return quarantine(cols, cls.arrow_schema(), cls.constraints(), rejected)
+
+    @classmethod
+    def index_fields(cls) -> List[str]:
+        fields = []
+        for field in cls.__known__:
+            meta = FieldMeta(**field.metadata)
+            if meta.index:
+                fields.append(meta.col_name)
+        return fields
+
     @classmethod
     def allowed(cls) -> List[str]:
         fields = []
@@ -1,6 +1,11 @@
-from typing import Callable
+from collections.abc import Generator
+from types import MethodType, ModuleType
+from typing import Callable, Optional, Union
+
+from pyarrow import Array, ChunkedArray, DataType, Schema, Table, array, from_numpy_dtype
 
 from tableclasses.base.field import FieldMeta
+from tableclasses.base.hooks import NULL, NullRecorder, Recorder
 from tableclasses.errs import ColumnError, GetRepr, RowError
 from tableclasses.types import CellValueGetter, ColumnLike, Indexable, RowValidator
 
@@ -82,3 +87,75 @@ def get_keyed(
         return other[name]
     except KeyError as e:
         raise ColumnError(meta, get_repr, other.columns) from e
+
+
+def get_table(other: Table, name: str, meta: FieldMeta, get_repr: GetRepr) -> ChunkedArray:
+    if name not in other.column_names:
+        raise ColumnError(meta, get_repr, other.column_names)
+    return other.column(name)
+
+
+def given_type(col: ColumnLike) -> Optional[DataType]:
+    dtype = getattr(col, "dtype", None)
+    if dtype is None:
+        return None
+    typ = getattr(dtype, "pyarrow_dtype", None)
+    if typ is not None:
+        return typ
+    try:
+        return from_numpy_dtype(dtype)
+    except (TypeError, NotImplementedError):
+        return None
+
+
+def as_arrow(
+    col: ColumnLike, typ: DataType, record: Union[Recorder, NullRecorder] = NULL
+) -> Union[Array, ChunkedArray]:
+    if isinstance(col, Generator):
+        col = list(col)
+    if not isinstance(col, (Array, ChunkedArray)):
+        if record is not NULL and given_type(col) not in (None, typ):
+            record.cast()
+        # pandas series backed by arrow hand over their arrays without a copy
+        col = array(col, type=typ, from_pandas=True)
+    if col.type != typ:
+        record.cast()
+        col = col.cast(typ)
+    return col
+
+
+def typed_table(cols: list[ColumnLike], schema: Schema, record: Union[Recorder, NullRecorder] = NULL) -> Table:
+    return Table.from_arrays([as_arrow(col, field.type, record) for col, field in zip(cols, schema)], schema=schema)
+
+
+def import_numpy() -> ModuleType:
+    # numpy is optional, only hashing, zone maps, sketches and matrices need it
+    try:
+        import numpy as np  # noqa: PLC0415
+    except ImportError as e:
+        err = "numpy is required for this feature, install tableclasses[numpy]"
+        raise ImportError(err) from e
+    return np
+
+
+class ModelMethod:
+    def __init__(self, func: Callable):
+        self.__func__ = func
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner: type, name: str):
+        self.name = name
+
+    def __get__(self, instance: any, owner: Optional[type] = None):
+        if instance is None:
+            return MethodType(self.__func__, owner)
+        # instances keep the tabular type's own method of the same name, e.g. DataFrame.filter
+        for klass in type(instance).__mro__:
+            attr = vars(klass).get(self.name)
+            if attr is not None and not isinstance(attr, ModelMethod):
+                return attr.__get__(instance, type(instance))
+        raise AttributeError(self.name)
+
+
+def modelmethod(func: Callable) -> ModelMethod:
+    return ModelMethod(func)
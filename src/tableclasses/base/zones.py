@@ -0,0 +1,158 @@
+from typing import TYPE_CHECKING, Any
+from weakref import finalize
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from tableclasses.base.expr import Column, Predicate
+from tableclasses.base.utils import import_numpy
+from tableclasses.errs import DataError
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from tableclasses.base.tabled import Base
+
+BLOOM_HASHES = 3
+BLOOM_BITS_PER_VALUE = 10
+
+RANGES = {
+    "equal": lambda lo, hi, v: lo <= v <= hi,
+    "less": lambda lo, _, v: lo < v,
+    "less_equal": lambda lo, _, v: lo <= v,
+    "greater": lambda _, hi, v: hi > v,
+    "greater_equal": lambda _, hi, v: hi >= v,
+}
+
+
+class Bloom:
+    __slots__ = ("bits", "mask")
+
+    def __init__(self, hashes: "np.ndarray"):
+        np = import_numpy()
+        size = 64
+        while size < len(hashes) * BLOOM_BITS_PER_VALUE:
+            size <<= 1
+        self.mask = np.uint64(size - 1)
+        self.bits = np.zeros(size >> 3, dtype=np.uint8)
+        for pos in self.positions(hashes):
+            np.bitwise_or.at(self.bits, pos >> np.uint64(3), np.uint8(1) << (pos & np.uint64(7)).astype(np.uint8))
+
+    def positions(self, hashes: "np.ndarray") -> list["np.ndarray"]:
+        np = import_numpy()
+        lo, hi = hashes & np.uint64(0xFFFFFFFF), hashes >> np.uint64(32)
+        return [(lo + np.uint64(i) * hi) & self.mask for i in range(BLOOM_HASHES)]
+
+    def may_contain(self, hashes: "np.ndarray") -> bool:
+        np = import_numpy()
+        found = np.ones(len(hashes), dtype=bool)
+        for pos in self.positions(hashes):
+            found &= (self.bits[pos >> np.uint64(3)] >> (pos & np.uint64(7)).astype(np.uint8)) & 1 == 1
+        return bool(found.any())
+
+
+class Stats:
+    __slots__ = ("bloom", "max", "min", "nulls", "rows")
+
+    def __init__(self, col: pa.Array, bloom: bool):
+        try:
+            lo, hi = pc.min_max(col).values()
+        except pa.ArrowNotImplementedError as e:
+            err = f"({col.type}) columns cannot be zone mapped"
+            raise DataError(err) from e
+        self.min = lo.as_py()
+        self.max = hi.as_py()
+        self.nulls = col.null_count
+        self.rows = len(col)
+        self.bloom = None
+        if bloom:
+            from tableclasses.base.hashing import hash_array  # noqa: PLC0415
+
+            self.bloom = Bloom(hash_array(pc.unique(col).drop_null()))
+
+
+class Zone:
+    __slots__ = ("length", "offset", "stats")
+
+    def __init__(self, offset: int, length: int, stats: dict[str, Stats]):
+        self.offset = offset
+        self.length = length
+        self.stats = stats
+
+
+def build_zones(table: pa.Table, fields: list[tuple[str, bool]]) -> list[Zone]:
+    zones = []
+    offset = 0
+    # record batches split every column at the same rows, unlike the chunks of single columns
+    for batch in table.to_batches():
+        stats = {name: Stats(batch.column(name), bloom) for name, bloom in fields}
+        zones.append(Zone(offset, batch.num_rows, stats))
+        offset += batch.num_rows
+    return zones
+
+
+def contains(stats: Stats, column: Column, values: list[Any]) -> bool:
+    values = [v for v in values if v is not None and stats.min <= v <= stats.max]
+    if len(values) == 0:
+        return False
+    if stats.bloom is None:
+        return True
+    from tableclasses.base.hashing import hash_array  # noqa: PLC0415
+
+    return stats.bloom.may_contain(hash_array(pa.array(values, type=column.type)))
+
+
+def may_match(where: Predicate, zone: Zone) -> bool:
+    # true unless the zone statistics prove that no row of the zone satisfies the predicate
+    if where.op == "and":
+        return all(may_match(arg, zone) for arg in where.args)
+    if where.op == "or":
+        return any(may_match(arg, zone) for arg in where.args)
+    if where.op not in (*RANGES, "is_in", "is_null", "is_valid"):
+        return True
+    column = where.args[0]
+    stats = zone.stats.get(column.name)
+    if stats is None:
+        return True
+    if where.op == "is_null":
+        return stats.nulls > 0
+    if where.op == "is_valid":
+        return stats.nulls < stats.rows
+    other = where.args[1]
+    if isinstance(other, Column):
+        return True
+    if stats.min is None:
+        return False
+    if where.op == "is_in":
+        return contains(stats, column, other.to_pylist())
+    value = other.as_py()
+    if value is None or not RANGES[where.op](stats.min, stats.max, value):
+        return False
+    if where.op == "equal":
+        return contains(stats, column, [value])
+    return True
+
+
+zone_cache: dict[int, dict[type, list[Zone]]] = {}
+
+
+def zone_maps(model: "type[Base]", table: pa.Table, fields: list[tuple[str, bool]]) -> list[Zone]:
+    # arrow tables are immutable, so their zones are kept for as long as the table is alive
+    key = id(table)
+    cached = zone_cache.get(key)
+    if cached is None:
+        cached = zone_cache[key] = {}
+        finalize(table, zone_cache.pop, key, None)
+    zones = cached.get(model)
+    if zones is None:
+        zones = cached[model] = build_zones(table, fields)
+    return zones
+
+
+def prune(table: pa.Table, zones: list[Zone], where: Predicate) -> pa.Table:
+    keep = [zone for zone in zones if may_match(where, zone)]
+    if len(keep) == len(zones):
+        return table
+    if len(keep) == 0:
+        return table.slice(0, 0)
+    return pa.concat_tables([table.slice(zone.offset, zone.length) for zone in keep])
@@ -1,10 +1,16 @@
+from copy import copy
 from dataclasses import Field, asdict, dataclass, fields, is_dataclass
 from datetime import date, datetime
-from typing import Callable, Dict, TypeVar
+from functools import lru_cache, partial
+from keyword import iskeyword
+from threading import RLock
+from typing import Any, Callable, Dict, Optional, TypeVar, Union
+from weakref import WeakKeyDictionary
 
 import pyarrow as pa
 
 from tableclasses.base.field import FieldMeta
+from tableclasses.base.field import field as model_field
 from tableclasses.base.tabled import Wrapped
 from tableclasses.errs import UnsupportedTypeError
 from tableclasses.types import ArrowType, Cls, TableType, TypeDict, TypeKey
@@ -51,11 +57,22 @@ types: Dict[TypeKey, Callable[[], ArrowType]] = {
 }
 
 
+class TypeMapping(dict):
+    def __init__(self, func: Callable[[ArrowType], TableType]):
+        super().__init__({kind: func(arrow_type()) for kind, arrow_type in types.items()})
+        # wraps arrow types which have no alias, e.g. the results of aggregations
+        self.wrap = func
+        # fields of the models tabled with this mapping, by class identity
+        self.compiled: WeakKeyDictionary[type, list[Field]] = WeakKeyDictionary()
+
+
 def map_types(func: Callable[[ArrowType], TableType]) -> TypeDict:
-    return {kind: func(arrow_type()) for kind, arrow_type in types.items()}
+    return TypeMapping(func)
 
 
 def resolve_type(types: TypeDict, native: type, alias: str) -> TableType:
+    if isinstance(alias, pa.DataType):
+        return types.wrap(alias)
     if alias == "":
         typ = types.get(native)
     else:
@@ -70,10 +87,59 @@ def resolve_type(types: TypeDict, native: type, alias: str) -> TableType:
     return typ
 
 
-def gen(cls: Cls, with_known: Callable[[list[Field], Cls], Wrapped], type_mapping: TypeDict) -> Wrapped:
-    orig = cls
-    if not is_dataclass(orig):
-        cls = dataclass(orig)
+@lru_cache(maxsize=None)
+def derive(name: str, specs: tuple[tuple[str, ArrowType, bool], ...], generate: Callable[[Cls], Wrapped]) -> Wrapped:
+    annotations = {}
+    namespace = {"__annotations__": annotations}
+    for i, (col_name, arrow, index) in enumerate(specs):
+        attr = col_name if col_name.isidentifier() and not iskeyword(col_name) else f"field_{i}"
+        annotations[attr] = object
+        namespace[attr] = model_field(arrow, index=index, col_name=col_name)
+    return generate(type(name, (), namespace))
+
+
+class Deferred:
+    def __init__(self, compile_known: Callable[[], list[Field]]):
+        self.compile_known = compile_known
+        self.finalize: Optional[Callable[[list[Field]], None]] = None
+        self.lock = RLock()
+
+    def __set_name__(self, owner: type, name: str):
+        self.owner = owner
+        self.name = name
+
+    def __get__(self, instance: Any, owner: type) -> list[Field]:
+        with self.lock:
+            known = vars(self.owner)[self.name]
+            if known is self:
+                known = self.compile_known()
+                # published first, finalize may look the fields up again, e.g. through dataclass()
+                setattr(self.owner, self.name, known)
+                if self.finalize is not None:
+                    try:
+                        self.finalize(known)
+                    except Exception:
+                        # left to compile again, so the model fails the same way every time
+                        setattr(self.owner, self.name, self)
+                        raise
+        return known
+
+
+compile_lock = RLock()
+
+
+def compile_known(cls: Cls, type_mapping: TypeMapping) -> list[Field]:
+    # dataclass() updates the class in place, so backends compiling the same class take turns
+    with compile_lock:
+        known = type_mapping.compiled.get(cls)
+        if known is None:
+            known = type_mapping.compiled[cls] = compile_fields(cls, type_mapping)
+    return known
+
+
+def compile_fields(cls: Cls, type_mapping: TypeMapping) -> list[Field]:
+    if not is_dataclass(cls):
+        cls = dataclass(cls)
 
     pre = fields(cls)
     known = []
@@ -86,6 +152,25 @@ def gen(cls: Cls, with_known: Callable[[list[Field], Cls], Wrapped], type_mappin
         meta.arrow = resolve_type(types=type_mapping, native=field.type, alias=meta.typ)
         if meta.col_name is None:
             meta.col_name = field.name
+        # the same class may be tabled by several backends
+        field = copy(field)  # noqa: PLW2901
         field.metadata = asdict(meta)
         known.append(field)
-    return with_known(known, orig)
+    return known
+
+
+def gen(
+    cls: Cls,
+    with_known: Callable[[Union[list[Field], Deferred], Cls], Wrapped],
+    type_mapping: TypeDict,
+    lazy: bool = False,  # noqa: FBT002
+) -> Wrapped:
+    orig = cls
+    if lazy:
+        known = Deferred(partial(compile_known, orig, type_mapping))
+    else:
+        known = compile_known(orig, type_mapping)
+    wrapped = with_known(known, orig)
+    # models derived from this one, e.g. aggregation results, use the same backend
+    wrapped.__derive__ = partial(derive, generate=partial(gen, with_known=with_known, type_mapping=type_mapping))
+    return wrapped
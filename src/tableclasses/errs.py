@@ -1,4 +1,4 @@
-from typing import Callable
+from typing import Callable, Optional
 
 from tableclasses.base.field import FieldMeta
 
@@ -6,9 +6,11 @@ GetRepr = Callable[[FieldMeta], str]
 
 
 class DataError(Exception):
-    def __init__(self, cause: str):
+    def __init__(self, cause: str, masks: Optional[dict] = None):
         msg = f"The provided data is invalid: {cause}"
         super().__init__(self, msg)
+        # boolean masks by column, true for the rows that failed
+        self.masks = {} if masks is None else masks
 
 
 class ColumnError(Exception):
@@ -41,3 +43,12 @@ class RowError(Exception):
     def __init__(self, row: any, allowed: str):
         msg = f"The given row(s) are not valid, and should instead be {allowed}. Given: {row}"
         super().__init__(msg)
+
+
+class ReservedNameError(Exception):
+    def __init__(self, model: str, name: str):
+        msg = (
+            f"{model}.{name} clashes with the model method of the same name. "
+            f"Rename the field, aliases=[{name!r}] keeps reading the {name} column"
+        )
+        super().__init__(msg)
@@ -1,38 +1,62 @@
-from dataclasses import Field, make_dataclass
-from typing import Generic, Optional
+from dataclasses import Field, dataclass, make_dataclass
+from functools import partial
+from types import new_class
+from typing import Generic, Optional, Union
 
 from pandas import ArrowDtype
 
 from tableclasses.base.field import FieldMeta
-from tableclasses.dc import gen, map_types
+from tableclasses.base.tabled import Base
+from tableclasses.dc import Deferred, gen, map_types
+from tableclasses.errs import ReservedNameError
 from tableclasses.pandas.tabled import DataFrame
 from tableclasses.types import Cls, P, T
 
 types = map_types(ArrowDtype)
 
+# dataclass fields become class attributes and would replace these, `c` already gives way to a field
+RESERVED = frozenset(name for klass in (Base, DataFrame) for name in vars(klass) if not name.startswith("_")) - {"c"}
+
 
 class Series(Generic[T]):
     ...
 
 
-def with_known(known: list[Field], cls: Cls) -> "DataFrame[Cls]":
-    slots: tuple[tuple[str, type], ...] = ()
+def slots(cls: Cls, known: list[Field]) -> tuple[tuple[str, type], ...]:
+    slotted: tuple[tuple[str, type], ...] = ()
     for field in known:
         meta = FieldMeta(**field.metadata)
-        slots += ((meta.col_name, Series[meta.col_name]),)
+        if meta.col_name in RESERVED:
+            raise ReservedNameError(cls.__name__, meta.col_name)
+        slotted += ((meta.col_name, Series[meta.col_name]),)
+    return slotted
+
+
+def as_dataclass(cls: Cls, known: list[Field]):
+    cls.__annotations__ = dict(slots(cls, known))
+    dataclass(cls, init=False)
+
 
+def with_known(known: Union[list[Field], Deferred], cls: Cls) -> "DataFrame[Cls]":
     class Wrapped(
         DataFrame[Cls],
     ):
         __known__ = known
 
-    cls = make_dataclass(
-        cls.__name__,
-        slots,
-        bases=(Wrapped,),
-        init=False,
-    )
-    return cls
+    if isinstance(known, Deferred):
+        # the dataclass fields are only known once the model compiles
+        wrapped = new_class(cls.__name__, (Wrapped,))
+        known.finalize = partial(as_dataclass, wrapped)
+    else:
+        wrapped = make_dataclass(
+            cls.__name__,
+            slots(cls, known),
+            bases=(Wrapped,),
+            init=False,
+        )
+    wrapped.__module__ = cls.__module__
+    wrapped.__qualname__ = cls.__qualname__
+    return wrapped
 
 
 def wrapper(cls: Optional[Cls] = None, *args: P.args, **kwargs: P.kwargs):
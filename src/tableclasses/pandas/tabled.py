@@ -1,16 +1,27 @@
 from collections.abc import Generator
-from typing import Annotated, Generic, TypeVar
+from typing import TYPE_CHECKING, Annotated, Generic, Optional, TypeVar, Union
 
 from beartype import beartype
 from beartype.vale import Is
+from pandas import ArrowDtype, Index, MultiIndex
 from pandas import DataFrame as _DataFrame
 from pandas import Series as _Series
+from pandas.arrays import ArrowExtensionArray
+from pyarrow import ChunkedArray
+from pyarrow import Table as _Table
 
 from tableclasses.base.field import FieldMeta
+from tableclasses.base.hooks import NULL, NullRecorder, Recorder, recorder
+from tableclasses.base.quarantine import Quarantined, rejections
 from tableclasses.base.tabled import Base
-from tableclasses.base.utils import get_column, get_keyed, must_get_col, resolve_row_fs
+from tableclasses.base.utils import get_column, get_keyed, get_table, must_get_col, resolve_row_fs, typed_table
+from tableclasses.errs import DataError, RowError
 from tableclasses.types import Cls, P, RowsLike
 
+if TYPE_CHECKING:
+    from tableclasses.base.quarantine import Rejections
+    from tableclasses.base.sketches import TableStats
+
 T = TypeVar("T")
 ColumnArgs = TypeVar("ColumnArgs", _Series, list, Generator)
 NamedColumns = dict[str, ColumnArgs]
@@ -32,10 +43,30 @@ def valid_rows(rows: RowsLike):
     return isinstance(rows, (list, Generator, tuple))
 
 
+def arrow_index(cols: list[ChunkedArray], names: list[str]) -> Index:
+    # index levels wrap the typed arrow arrays instead of being laid out as data columns first
+    arrays = [ArrowExtensionArray(col) for col in cols]
+    if len(arrays) == 1:
+        return Index(arrays[0], name=names[0], copy=False)
+    return MultiIndex.from_arrays(arrays, names=names)
+
+
+def check_index(index: Index):
+    # pandas caches both on the index, so .loc lookups skip the checks afterwards
+    if not index.is_unique:
+        err = "({:}) contains duplicate keys".format(",".join(map(str, index.names)))
+        raise DataError(err)
+    index.is_monotonic_increasing  # noqa: B018
+
+
+def from_reduced(cls: type["DataFrame"], table: _Table) -> "DataFrame":
+    return cls._from_arrow(table)
+
+
 class DataFrame(
     Generic[Cls],
-    _DataFrame,
     Base[Cls, _DataFrame],
+    _DataFrame,
 ):
     def set_index(self, *args: P.args, **kwargs: P.kwargs):
         try:
@@ -45,68 +76,177 @@ class DataFrame(
         super().set_index(*args, **kwargs, inplace=True)
         return self
 
+    def _model_table(self) -> Optional[_Table]:
+        # frames changed after construction no longer match the model and are exported as plain frames
+        names = [name for name in self.index.names if name is not None] + list(self.columns)
+        schema = self.arrow_schema()
+        if sorted(names) != sorted(schema.names):
+            return None
+        table = self._to_arrow(self).select(schema.names)
+        if table.schema.types != schema.types:
+            return None
+        # same types, so the model's field and schema metadata are attached without a cast
+        return _Table.from_arrays(table.columns, schema=schema)
+
+    def __reduce_ex__(self, protocol: int):
+        # pickled as the arrow table, which hands its buffers out of band under protocol 5
+        table = self._model_table()
+        if table is None:
+            return super().__reduce_ex__(protocol)
+        return (from_reduced, (type(self), table))
+
+    def __arrow_c_stream__(self, requested_schema: Optional[object] = None):
+        table = self._model_table()
+        if table is None:
+            return super().__arrow_c_stream__(requested_schema)
+        return table.__arrow_c_stream__(requested_schema)
+
+    def __arrow_c_schema__(self):
+        table = self._model_table()
+        schema = _Table.from_pandas(self).schema if table is None else table.schema
+        return schema.__arrow_c_schema__()
+
+    @classmethod
+    def _to_arrow(cls, data: _DataFrame) -> _Table:
+        if any(name is not None for name in data.index.names):
+            data = data.reset_index()
+        return _Table.from_pandas(data, preserve_index=False)
+
+    @classmethod
+    def _from_arrow(cls, table: _Table):
+        record = recorder(cls, "from_arrow", table)
+        cols = []
+        cls.validate_allowed(table.column_names)
+        record.mark("validate")
+        for field in cls.__known__:
+            meta = FieldMeta(**field.metadata)
+            cols.append(must_get_col(get_table, table, meta, allowed_repr))
+        record.mark("resolve")
+        return cls._from_columns(cols, record=record)
+
+    @classmethod
+    def _from_columns(
+        cls,
+        cols: list,
+        verify_index: bool = False,  # noqa: FBT002
+        record: Union[Recorder, NullRecorder] = NULL,
+        stats: Optional["TableStats"] = None,
+    ):
+        # one typed arrow table, converted once, with the arrow buffers handed to pandas as is
+        table = typed_table(cols, cls.arrow_schema(), record)
+        record.mark("convert")
+        cls.check_constraints(table)
+        record.mark("constraints")
+        if stats is not None:
+            stats.update(table)
+            record.mark("stats")
+        rows, size = table.num_rows, table.nbytes
+        idx = cls.index_fields()
+        index = None
+        if len(idx) > 0:
+            index = arrow_index([table.column(name) for name in idx], idx)
+            table = table.drop_columns(idx)
+        frame = table.to_pandas(types_mapper=ArrowDtype, split_blocks=True, self_destruct=True)
+        record.mark("frame")
+        if index is not None:
+            frame.index = index
+            if verify_index:
+                check_index(index)
+            record.mark("index")
+        out = cls(frame, copy=False)
+        record.emit(rows, size)
+        if stats is not None:
+            from tableclasses.base.sketches import remember  # noqa: PLC0415
+
+            remember(out, stats)
+        return out
+
     @beartype
     @classmethod
-    def from_columns(cls, columns: Annotated[NamedColumns, Is[valid_cols]]):
-        cols = {}
-        idx = []
+    def from_columns(
+        cls,
+        columns: Annotated[NamedColumns, Is[valid_cols]],
+        verify_index: bool = False,  # noqa: FBT002
+        stats: Union[bool, list, None] = None,
+        errors: str = "raise",
+    ):
+        rejected = rejections(errors)
+        record = recorder(cls, "from_columns", columns)
+        cols = []
         cls.validate_allowed(columns.keys())
+        record.mark("validate")
         for field in cls.__known__:
             meta = FieldMeta(**field.metadata)
-            col = must_get_col(get_column, columns, meta, allowed_repr)
-            cols[meta.col_name] = _Series(col).astype(meta.arrow)
-            if meta.index:
-                idx.append(meta.col_name)
-        self = cls(cols)
-        if len(idx) > 0:
-            self = self.set_index(idx)
-        return self
+            cols.append(must_get_col(get_column, columns, meta, allowed_repr))
+        record.mark("resolve")
+        if rejected is not None:
+            return cls._from_quarantine(cols, rejected, verify_index, record, cls.collect_stats(stats))
+        return cls._from_columns(cols, verify_index, record, cls.collect_stats(stats))
 
     @beartype
     @classmethod
-    def from_existing(cls, other: _DataFrame):
-        data = {}
-        idx = []
+    def from_existing(cls, other: _DataFrame, verify_index: bool = False):  # noqa: FBT002
+        record = recorder(cls, "from_existing", other)
+        cols = []
         cls.validate_allowed(other.columns)
+        record.mark("validate")
         for field in cls.__known__:
             meta = FieldMeta(**field.metadata)
-            colname = meta.col_name
-            col = must_get_col(get_keyed, other, meta, allowed_repr)
-            data[colname] = _Series(col).astype(meta.arrow)
-            if meta.index:
-                idx.append(colname)
-        self = cls(data)
-        if len(idx) > 0:
-            self = self.set_index(idx)
-        return self
+            cols.append(must_get_col(get_keyed, other, meta, allowed_repr))
+        record.mark("resolve")
+        return cls._from_columns(cols, verify_index, record)
 
     @beartype
     @classmethod
-    def from_rows(cls, rows: RowsLike, allow_positional: bool = False):  # noqa: FBT002
-        keyed = {}
+    def from_rows(
+        cls,
+        rows: RowsLike,
+        allow_positional: bool = False,  # noqa: FBT002
+        verify_index: bool = False,  # noqa: FBT002
+        stats: Union[bool, list, None] = None,
+        errors: str = "raise",
+    ):
+        rejected = rejections(errors)
+        record = recorder(cls, "from_rows")
+        cols = []
         getter = None
         checker = None
         num = len(cls.__known__)
-        idx = []
         for i, known in enumerate(cls.__known__):
             meta = FieldMeta(**known.metadata)
             values = []
-            for row in rows:
+            for j, row in enumerate(rows):
                 if getter is None or checker is None:
-                    (getter, checker) = resolve_row_fs(row=row, name=meta.col_name, allow_positional=allow_positional)
-
-                checker(row, num)
-                value = getter(row, meta.col_name, i)
+                    getter, checker = resolve_row_fs(row=row, name=meta.col_name, allow_positional=allow_positional)
+
+                try:
+                    checker(row, num)
+                    value = getter(row, meta.col_name, i)
+                except RowError as e:
+                    if rejected is None:
+                        raise
+                    # the whole row is rejected, once, and its cells are left empty
+                    if i == 0:
+                        rejected.add(j, None, str(e))
+                    value = None
 
                 values.append(value)
 
-            keyed[meta.col_name] = _Series(
-                values,
-                dtype=meta.arrow,
-            )
-            if meta.index:
-                idx.append(meta.col_name)
-        self = cls(keyed)
-        if len(idx) > 0:
-            self = self.set_index(idx)
-        return self
+            cols.append(values)
+        record.mark("rows")
+        if rejected is not None:
+            return cls._from_quarantine(cols, rejected, verify_index, record, cls.collect_stats(stats))
+        return cls._from_columns(cols, verify_index, record, cls.collect_stats(stats))
+
+    @classmethod
+    def _from_quarantine(
+        cls,
+        cols: list,
+        rejected: "Rejections",
+        verify_index: bool,
+        record: Union[Recorder, NullRecorder],
+        stats: Optional["TableStats"] = None,
+    ) -> Quarantined:
+        table = cls.quarantine(cols, rejected)
+        record.mark("quarantine")
+        return Quarantined(cls._from_columns(table.columns, verify_index, record, stats), rejected.to_table())
@@ -0,0 +1,88 @@
+import pandas as pd
+import pyarrow as pa
+
+from tableclasses.arrow import tabled as arrow_tabled
+from tableclasses.base.field import field
+from tableclasses.errs import DataError
+from tableclasses.pandas import tabled as pandas_tabled
+
+from .utils import not_caught
+
+
+@arrow_tabled
+class ArrowSales:
+    region: str = field("string", index=True, aliases=["r"])
+    amount: float = field("float64")
+    units: int = field("int32")
+
+
+@pandas_tabled
+class PandasSales:
+    region: str = field("string", index=True)
+    amount: float = field("float64")
+    units: int = field("int32")
+
+
+DATA = {
+    "region": ["eu", "us", "eu", "apac"],
+    "amount": [1.0, 2.0, 3.0, 4.0],
+    "units": [1, 1, 2, 5],
+}
+
+
+def test_aggregate_arrow():
+    t = ArrowSales.from_columns(DATA)
+    out = ArrowSales.aggregate(t, aggs={"amount": "sum", "most": ("units", "max"), "n": (None, "count_all")})
+    assert out.column_names == ["region", "amount_sum", "most", "n"]
+    assert out.schema.field("most").type == pa.int32()
+    rows = {row["region"]: row for row in out.to_pylist()}
+    assert rows["eu"] == {"region": "eu", "amount_sum": 4.0, "most": 2, "n": 2}
+
+    out = ArrowSales.aggregate(t, by=[], aggs={"total": (ArrowSales.c.units, "sum")})
+    assert out.to_pylist() == [{"total": 9}]
+
+    out = ArrowSales.aggregate(t, by=["r"])
+    assert sorted(out.column("count").to_pylist()) == [1, 1, 2]
+
+
+def test_aggregate_pandas():
+    df = PandasSales.from_columns(DATA)
+    out = PandasSales.aggregate(df, aggs={"amount": "mean", "units": "sum"})
+    assert type(out).__name__ == "PandasSalesAggregate"
+    assert out.index.name == "region"
+    assert out.loc["eu", "amount_mean"] == 2.0
+    assert out.units_sum.dtype == pd.ArrowDtype(pa.int64())
+
+    # the derived model is cached and reused
+    again = PandasSales.aggregate(df, aggs={"amount": "mean", "units": "sum"})
+    assert type(again) is type(out)
+
+
+def test_aggregate_nested_types():
+    t = ArrowSales.from_columns(DATA)
+    out = ArrowSales.aggregate(t, aggs={"all": ("units", "list"), "range": ("amount", "min_max")})
+    assert out.schema.field("all").type == pa.list_(pa.int32())
+    rows = {row["region"]: row for row in out.to_pylist()}
+    assert rows["eu"]["all"] == [1, 2]
+    assert rows["eu"]["range"] == {"min": 1.0, "max": 3.0}
+
+    df = PandasSales.from_columns(DATA)
+    out = PandasSales.aggregate(df, aggs={"units": "distinct"})
+    assert out.units_distinct.dtype == pd.ArrowDtype(pa.list_(pa.int32()))
+
+
+def test_aggregate_errs():
+    t = ArrowSales.from_columns(DATA)
+    for aggs in [
+        {"missing": "sum"},
+        {"amount": ("units",)},
+        {"a": ("amount", "sum"), "amount_sum": "amount"},
+        {"units": ("units", "nosuch")},
+    ]:
+        try:
+            ArrowSales.aggregate(t, aggs=aggs)
+            not_caught()
+        except RuntimeError as e:
+            raise e
+        except DataError:
+            pass
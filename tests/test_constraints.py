@@ -0,0 +1,70 @@
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from tableclasses.arrow import tabled as arrow_tabled
+from tableclasses.base.field import field
+from tableclasses.errs import DataError
+from tableclasses.pandas import tabled as pandas_tabled
+
+from .utils import not_caught
+
+
+@arrow_tabled
+class ArrowModel:
+    a: int = field("int64", ge=0, le=10, unique=True)
+    b: str = field("string", pattern="^[a-z]+$", not_null=True)
+    c: str = field("string", isin=["x", "y"])
+
+
+@pandas_tabled
+class PandasModel:
+    a: int = field("int64", index=True, ge=0)
+    b: str = field("string", not_null=True)
+
+
+def test_constraints_pass():
+    t = ArrowModel.from_columns({"a": [0, 10, None], "b": ["a", "bc", "d"], "c": ["x", None, "y"]})
+    assert t.num_rows == 3
+    df = PandasModel.from_columns({"a": [1, 2], "b": ["a", "b"]})
+    assert list(df["b"]) == ["a", "b"]
+
+
+def test_constraints_masks():
+    try:
+        ArrowModel.from_columns({"a": [-1, 3, 3, 11], "b": ["a", "B", None, "c"], "c": ["x", "z", None, "y"]})
+        not_caught()
+    except DataError as e:
+        assert pc.indices_nonzero(e.masks["a"]).to_pylist() == [0, 1, 2, 3]
+        assert pc.indices_nonzero(e.masks["b"]).to_pylist() == [1, 2]
+        assert pc.indices_nonzero(e.masks["c"]).to_pylist() == [1]
+        assert "a.ge" in str(e)
+        assert "a.unique" in str(e)
+        assert "b.not_null" in str(e)
+
+
+def test_constraints_existing():
+    table = pa.table({"a": [1, 1], "b": ["a", "b"], "c": ["x", "x"]})
+    try:
+        ArrowModel.from_existing(table)
+        not_caught()
+    except DataError as e:
+        assert list(e.masks) == ["a"]
+
+    try:
+        PandasModel.from_rows([{"a": -1, "b": None}, {"a": 1, "b": "b"}])
+        not_caught()
+    except DataError as e:
+        assert e.masks["a"].to_pylist() == [True, False]
+        assert e.masks["b"].to_pylist() == [True, False]
+
+
+def test_constraints_invalid():
+    @arrow_tabled
+    class Invalid:
+        a: int = field("int64", ge="zero")
+
+    try:
+        Invalid.from_columns({"a": [1]})
+        not_caught()
+    except DataError:
+        pass
@@ -0,0 +1,100 @@
+from datetime import date
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from tableclasses.arrow import tabled as arrow_tabled
+from tableclasses.base.field import field
+from tableclasses.errs import DataError
+from tableclasses.pandas import tabled as pandas_tabled
+
+from .utils import not_caught
+
+
+@arrow_tabled
+class ArrowEvent:
+    day: date = field("date")
+    tenant: str = field("string")
+    value: float = field("float64")
+
+
+@pandas_tabled
+class PandasEvent:
+    day: date = field("date", index=True)
+    tenant: str = field("string")
+    value: float = field("float64")
+
+
+DAYS = [date(2023, 8, 1), date(2023, 8, 1), date(2023, 8, 2), date(2023, 8, 3)]
+DATA = {
+    "day": DAYS,
+    "tenant": ["a", "b", "a", "b"],
+    "value": [1.0, 2.0, 3.0, 4.0],
+}
+
+
+def test_roundtrip_arrow(tmp_path):
+    t = ArrowEvent.from_columns(DATA)
+    ArrowEvent.write_dataset(t, tmp_path, partition_by=["day", "tenant"], max_rows_per_file=1)
+
+    dataset = ArrowEvent.open_dataset(tmp_path)
+    assert dataset.schema == ArrowEvent.arrow_schema()
+    assert dataset.count_rows() == 4
+    assert len(list(dataset.fragments())) == 4
+
+    pruned = dataset.filter(ArrowEvent.c.day == date(2023, 8, 1)).filter(ArrowEvent.c.tenant == "b")
+    assert len(list(pruned.fragments())) == 1
+    out = pruned.to_table()
+    assert out.schema == ArrowEvent.arrow_schema()
+    assert out.column("value").to_pylist() == [2.0]
+
+    batches = list(dataset.to_batches(columns=["value"]))
+    assert sum(batch.num_rows for batch in batches) == 4
+    try:
+        dataset.to_table(columns=["value"])
+        not_caught()
+    except RuntimeError as e:
+        raise e
+    except DataError:
+        pass
+
+
+def test_existing_data(tmp_path):
+    t = ArrowEvent.from_columns(DATA)
+    ArrowEvent.write_dataset(t, tmp_path, partition_by=["tenant"])
+    try:
+        ArrowEvent.write_dataset(t, tmp_path, partition_by=["tenant"])
+        not_caught()
+    except RuntimeError as e:
+        raise e
+    except pa.ArrowInvalid:
+        pass
+
+    ArrowEvent.write_dataset(
+        ArrowEvent.filter(t, ArrowEvent.c.tenant == "a"),
+        tmp_path,
+        partition_by=["tenant"],
+        existing_data_behavior="delete_matching",
+    )
+    assert ArrowEvent.open_dataset(tmp_path).count_rows() == 4
+
+
+def test_roundtrip_pandas(tmp_path):
+    df = PandasEvent.from_columns(DATA)
+    PandasEvent.write_dataset(df, tmp_path, partition_by=[PandasEvent.c.tenant])
+
+    out = PandasEvent.open_dataset(tmp_path).filter(PandasEvent.c.value > 1.5).to_table()
+    assert isinstance(out, PandasEvent)
+    assert out.index.name == "day"
+    assert sorted(out.value) == [2.0, 3.0, 4.0]
+
+
+def test_open_invalid(tmp_path):
+    pq.write_table(pa.table({"day": DAYS, "other": [1, 2, 3, 4]}), tmp_path / "part.parquet")
+    try:
+        ArrowEvent.open_dataset(tmp_path)
+        not_caught()
+    except RuntimeError as e:
+        raise e
+    except DataError:
+        pass
@@ -0,0 +1,79 @@
+import pyarrow as pa
+
+from tableclasses.arrow import tabled as arrow_tabled
+from tableclasses.base.dedupe import SeenHashes
+from tableclasses.base.field import field
+from tableclasses.errs import DataError
+from tableclasses.pandas import tabled as pandas_tabled
+
+from .utils import not_caught
+
+
+@arrow_tabled
+class ArrowModel:
+    a: int = field("int64", index=True)
+    b: str = field("string", index=True)
+    c: float = field("float64")
+
+
+@pandas_tabled
+class PandasModel:
+    a: int = field("int64", index=True)
+    c: float = field("float64")
+
+
+DATA = {
+    "a": [1, 1, 2, 1, None],
+    "b": ["x", "y", "x", "x", None],
+    "c": [1.0, 2.0, 3.0, 4.0, 5.0],
+}
+
+
+def test_row_hash():
+    t = ArrowModel.from_columns(DATA)
+    hashes = ArrowModel.row_hash(t)
+    assert hashes.type == pa.uint64()
+    values = hashes.to_pylist()
+    assert values[0] == values[3]
+    assert len(set(values)) == 4
+
+    # stable across calls and independent of chunking
+    chunked = pa.concat_tables([t.slice(0, 2), t.slice(2)])
+    assert ArrowModel.row_hash(chunked).to_pylist() == values
+    by_a = ArrowModel.row_hash(t, fields=[ArrowModel.__columns__.a]).to_pylist()
+    assert by_a[0] == by_a[1] == by_a[3]
+    assert by_a[0] != values[0]
+
+
+def test_dedupe():
+    t = ArrowModel.from_columns(DATA)
+    assert ArrowModel.dedupe(t).column("c").to_pylist() == [1.0, 2.0, 3.0, 5.0]
+    assert ArrowModel.dedupe(t, keep="last").column("c").to_pylist() == [2.0, 3.0, 4.0, 5.0]
+    assert ArrowModel.dedupe(t, fields=["b"]).column("c").to_pylist() == [1.0, 2.0, 5.0]
+
+    df = PandasModel.from_columns({"a": [1, 2, 1], "c": [1.0, 2.0, 3.0]})
+    out = PandasModel.dedupe(df, keep="last")
+    assert isinstance(out, PandasModel)
+    assert out["c"].tolist() == [2.0, 3.0]
+
+    try:
+        ArrowModel.dedupe(t, keep="middle")
+        not_caught()
+    except DataError:
+        pass
+
+
+def test_seen_hashes(tmp_path):
+    seen = SeenHashes()
+    first = ArrowModel.from_columns({"a": [1, 2], "b": ["x", "x"], "c": [1.0, 2.0]})
+    replay = ArrowModel.from_columns({"a": [2, 3, 3], "b": ["x", "x", "x"], "c": [2.0, 3.0, 3.5]})
+    assert ArrowModel.dedupe(first, seen=seen).num_rows == 2
+    assert ArrowModel.dedupe(replay, seen=seen).column("a").to_pylist() == [3]
+    assert len(seen) == 3
+    # new hashes are inserted in order, repeats are not added again
+    seen.add(seen.hashes[:1])
+    assert seen.hashes.tolist() == sorted(set(seen.hashes.tolist()))
+
+    seen.save(tmp_path / "seen.npy")
+    restored = SeenHashes.load(tmp_path / "seen.npy")
+    assert ArrowModel.dedupe(replay, seen=restored).num_rows == 0
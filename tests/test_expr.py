@@ -0,0 +1,93 @@
+from dataclasses import MISSING, fields
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from tableclasses.arrow import tabled as arrow_tabled
+from tableclasses.base.expr import Predicate
+from tableclasses.base.field import field
+from tableclasses.errs import DataError
+from tableclasses.pandas import tabled as pandas_tabled
+
+from .utils import get_data, not_caught
+
+
+@arrow_tabled
+class ArrowModel:
+    a: int = field("int32", aliases=["f"])
+    b: str = field("string")
+    x: float = field("float64", aliases=["c"])
+
+
+@pandas_tabled
+class PandasModel:
+    a: int = field("int32", index=True)
+    b: str = field("string")
+    c: float = field("float64")
+
+
+def get_columns():
+    data = get_data()
+    return {"a": data["a"], "b": data["b"], "c": data["c"]}
+
+
+def test_columns():
+    assert [col.name for col in ArrowModel.c] == ["a", "b", "x"]
+    assert ArrowModel.c.f is ArrowModel.c.a
+    assert ArrowModel.c.c is ArrowModel.c["x"]
+    assert ArrowModel.c["b"].type == pa.string()
+    assert not hasattr(ArrowModel.c, "missing")
+    assert getattr(ArrowModel.c, "missing", None) is None
+    try:
+        ArrowModel.c["missing"]
+        not_caught()
+    except RuntimeError as e:
+        raise e
+    except DataError:
+        pass
+
+
+def test_columns_shadowed_by_field():
+    # a field named `c` keeps its name, the columns stay reachable through __columns__
+    assert not hasattr(PandasModel, "c")
+    assert PandasModel.__columns__.a.type == pa.int32()
+    assert PandasModel.__columns__.c.type == pa.float64()
+    for f in fields(PandasModel):
+        assert f.default is MISSING
+
+
+def test_expressions():
+    where = (ArrowModel.c.a > 1) & (ArrowModel.c.b != "c")
+    assert isinstance(where, Predicate)
+    assert where.op == "and"
+    assert where.expression.equals((pc.field("a") > pa.scalar(1, pa.int32())) & (pc.field("b") != "c"))
+
+    try:
+        ArrowModel.c.a > "abc"  # noqa: B015
+        not_caught()
+    except RuntimeError as e:
+        raise e
+    except DataError:
+        pass
+
+
+def test_filter_arrow():
+    t = ArrowModel.from_columns(get_columns())
+    out = ArrowModel.filter(t, (ArrowModel.c.a >= 2) & ~ArrowModel.c.b.isin(["c"]))
+    assert out.column("a").to_pylist() == [2]
+
+    out = ArrowModel.filter(t, ArrowModel.c.c.between(1.5, 3.0) | (pc.field("a") == 1))
+    assert out.column("a").to_pylist() == [1, 2, 3]
+
+
+def test_filter_pandas():
+    df = PandasModel.from_columns(get_columns())
+    out = PandasModel.filter(df, PandasModel.__columns__.a > 1)
+    assert isinstance(out, PandasModel)
+    assert list(out.index) == [2, 3]
+    assert out.c.dtype == pd.ArrowDtype(pa.float64())
+
+    # instances keep the pandas api for names shared with the model
+    assert list(df.filter(items=["b"]).columns) == ["b"]
+    assert df.c.sum() == 6.0
@@ -0,0 +1,67 @@
+import pandas as pd
+import pyarrow as pa
+
+from tableclasses.arrow import tabled as arrow_tabled
+from tableclasses.base.field import field
+from tableclasses.base.hooks import NULL, add_hook, recorder, remove_hook
+from tableclasses.pandas import tabled as pandas_tabled
+
+from .utils import get_row_dicts
+
+
+@arrow_tabled
+class ArrowModel:
+    a: int = field("int64")
+    b: str = field("string", aliases=["B"])
+
+
+@pandas_tabled
+class PandasModel:
+    a: int = field("int64", index=True)
+    b: str = field("string")
+    c: float = field("float64")
+
+
+def test_hooks_disabled():
+    assert recorder(ArrowModel, "from_columns") is NULL
+
+
+def test_model_hook():
+    events = []
+    add_hook(events.append, ArrowModel)
+    try:
+        table = pa.table({"a": [1, 2], "B": ["x", "y"]})
+        ArrowModel.from_existing(table)
+        PandasModel.from_columns({"a": [1], "b": ["x"], "c": [1.0]})
+    finally:
+        remove_hook(events.append, ArrowModel)
+    assert recorder(ArrowModel, "from_columns") is NULL
+
+    (event,) = events
+    assert event.model == "ArrowModel"
+    assert event.constructor == "from_existing"
+    assert list(event.phases) == ["validate", "resolve", "convert", "constraints"]
+    assert event.rows == 2
+    assert event.input_bytes == table.nbytes
+    assert event.output_bytes > 0
+    assert event.casts == 0
+
+
+def test_global_hook():
+    events = []
+    add_hook(events.append)
+    try:
+        rows = [{name: row[name] for name in "abc"} for row in get_row_dicts()]
+        PandasModel.from_rows(rows)
+        PandasModel.from_columns({"a": pd.Series([1], dtype="int32"), "b": ["x"], "c": [1.0]})
+    finally:
+        remove_hook(events.append)
+
+    rows, cols = events
+    assert rows.constructor == "from_rows"
+    assert list(rows.phases) == ["rows", "convert", "constraints", "frame", "index"]
+    assert rows.rows == 3
+    assert rows.input_bytes == 0
+    assert cols.constructor == "from_columns"
+    assert cols.casts == 1
+    assert cols.input_bytes > 0
@@ -0,0 +1,76 @@
+import subprocess
+import sys
+from os import environ, pathsep
+from pathlib import Path
+
+SRC = Path(__file__).parent.parent / "src"
+
+# self time of the tableclasses modules, dependencies such as pyarrow are excluded
+IMPORT_BUDGET_US = 100_000
+
+
+def import_time(module: str) -> tuple[dict[str, int], list[str]]:
+    env = {**environ, "PYTHONPATH": pathsep.join((str(SRC), environ.get("PYTHONPATH", "")))}
+    code = f"import sys; import {module}; print(','.join(sys.modules))"
+    proc = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    )
+    timed = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, _, name = line.removeprefix("import time:").split("|")
+        timed[name.strip()] = int(own)
+    return timed, proc.stdout.strip().split(",")
+
+
+def test_arrow_without_pandas():
+    timed, modules = import_time("tableclasses.arrow")
+    assert "tableclasses.arrow" in modules
+    assert "pandas" not in modules
+
+    own = sum(us for name, us in timed.items() if name.startswith("tableclasses"))
+    assert own < IMPORT_BUDGET_US
+
+
+def test_pandas_backend():
+    _, modules = import_time("tableclasses.pandas")
+    assert "pandas" in modules
+
+
+def without_numpy(code: str) -> subprocess.CompletedProcess:
+    env = {**environ, "PYTHONPATH": pathsep.join((str(SRC), environ.get("PYTHONPATH", "")))}
+    block = "import sys; sys.modules['numpy'] = None; "
+    return subprocess.run(  # noqa: S603
+        [sys.executable, "-c", block + code],
+        capture_output=True,
+        check=False,
+        env=env,
+        text=True,
+    )
+
+
+def test_numpy_features_without_numpy():
+    code = (
+        "import pyarrow as pa; from tableclasses.base.hashing import hash_rows; "
+        "hash_rows(pa.table({'a': [1, 2]}), ['a'])"
+    )
+    proc = without_numpy(code)
+    assert proc.returncode != 0
+    assert "install tableclasses[numpy]" in proc.stderr
+
+
+def test_arrow_without_numpy():
+    code = (
+        "from tableclasses.arrow import tabled; from tableclasses.base.field import field\n"
+        "class M:\n    a: int = field('int8')\n"
+        "out = tabled(M).from_columns({'a': [1, 'x', 2]}, errors='quarantine')\n"
+        "assert out.table.column('a').to_pylist() == [1, 2]\n"
+        "assert out.rejected.column('row').to_pylist() == [1]\n"
+    )
+    proc = without_numpy(code)
+    assert proc.returncode == 0, proc.stderr
@@ -0,0 +1,69 @@
+import json
+
+import pyarrow as pa
+
+from tableclasses.arrow import tabled as arrow_tabled
+from tableclasses.base.field import field
+from tableclasses.errs import DataError
+from tableclasses.pandas import tabled as pandas_tabled
+
+from .utils import not_caught
+
+
+@arrow_tabled
+class ArrowModel:
+    a: int = field("int64", index=True)
+    b: str = field("string", aliases=["B"])
+
+
+@pandas_tabled
+class PandasModel:
+    a: int = field("int64", index=True)
+    b: str = field("string", aliases=["B"])
+
+
+class Producer:
+    def __init__(self, table: pa.Table):
+        self.table = table
+
+    def __arrow_c_stream__(self, requested_schema=None):
+        return self.table.__arrow_c_stream__(requested_schema)
+
+
+def test_schema_metadata():
+    schema = ArrowModel.arrow_schema()
+    assert schema.metadata[b"tableclasses.model"] == b"ArrowModel"
+    assert schema.field("a").metadata[b"tableclasses.index"] == b"true"
+    assert json.loads(schema.field("b").metadata[b"tableclasses.aliases"]) == ["B"]
+
+
+def test_export():
+    t = ArrowModel.from_columns({"a": [1, 2], "b": ["x", "y"]})
+    assert pa.table(t).schema.field("b").metadata[b"tableclasses.aliases"] == b'["B"]'
+
+    df = PandasModel.from_columns({"a": [1, 2], "b": ["x", "y"]})
+    exported = pa.RecordBatchReader.from_stream(df).read_all()
+    assert exported.schema.names == ["a", "b"]
+    assert exported.schema.metadata[b"tableclasses.model"] == b"PandasModel"
+    assert exported.column("a").to_pylist() == [1, 2]
+    assert pa.schema(df).field("a").metadata[b"tableclasses.index"] == b"true"
+
+
+def test_from_arrow():
+    data = pa.table({"B": pa.array(["x", "y"]), "a": pa.array([1, 2], pa.int32())})
+    t = ArrowModel.from_arrow(Producer(data))
+    assert t.schema == ArrowModel.arrow_schema()
+    assert t.column("b").to_pylist() == ["x", "y"]
+
+    df = PandasModel.from_arrow(Producer(t))
+    assert isinstance(df, PandasModel)
+    assert list(df.index) == [1, 2]
+
+    batch = pa.record_batch({"a": [3], "b": ["z"]})
+    assert ArrowModel.from_arrow(batch).column("a").to_pylist() == [3]
+
+    try:
+        ArrowModel.from_arrow({"a": [1]})
+        not_caught()
+    except DataError:
+        pass
@@ -0,0 +1,70 @@
+import io
+import json
+from datetime import date, time
+
+import pyarrow as pa
+
+from tableclasses.arrow import tabled as arrow_tabled
+from tableclasses.base.field import field
+from tableclasses.errs import DataError
+from tableclasses.pandas import tabled as pandas_tabled
+
+from .utils import not_caught
+
+
+@arrow_tabled
+class ArrowEvent:
+    day: date = field("date")
+    at: time = field(pa.time64("us"))
+    tenant: str = field("string", aliases=["account"])
+    value: float = field("float64")
+
+
+@pandas_tabled
+class PandasEvent:
+    day: date = field("date", index=True)
+    tenant: str = field("string", aliases=["account"])
+    value: float = field("float64")
+
+
+ROWS = [
+    {"day": "2023-08-01", "at": "10:00:00", "tenant": "a", "value": 1},
+    {"day": "2023-08-02", "at": "11:30:00", "account": "b", "value": 2.5},
+    {"day": "2023-08-03", "at": "12:00:00.5", "tenant": "c"},
+]
+
+
+def lines(rows):
+    return io.BytesIO("\n".join(json.dumps(row) for row in rows).encode())
+
+
+def test_read_json_arrow():
+    t = ArrowEvent.read_json(lines(ROWS))
+    assert t.schema == ArrowEvent.arrow_schema()
+    assert t.column("day").to_pylist() == [date(2023, 8, 1), date(2023, 8, 2), date(2023, 8, 3)]
+    assert t.column("at").to_pylist() == [time(10), time(11, 30), time(12, 0, 0, 500000)]
+    assert t.column("tenant").to_pylist() == ["a", "b", "c"]
+    assert t.column("value").to_pylist() == [1.0, 2.5, None]
+
+
+def test_read_json_stream():
+    rows = [{"day": "2023-08-01", "tenant": str(i), "value": i} for i in range(1000)]
+    batches = list(PandasEvent.read_json(lines(rows), block_size=1 << 12, stream=True))
+    assert len(batches) > 1
+    assert all(isinstance(batch, PandasEvent) for batch in batches)
+    assert sum(len(batch) for batch in batches) == 1000
+    assert batches[0].index.name == "day"
+
+
+def test_read_json_unknown():
+    try:
+        PandasEvent.read_json(lines([{"day": "2023-08-01", "other": 1}]))
+        not_caught()
+    except DataError:
+        pass
+
+    try:
+        list(PandasEvent.read_json(lines([{"day": "2023-08-01", "value": "x"}]), stream=True))
+        not_caught()
+    except DataError:
+        pass
@@ -0,0 +1,83 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import MISSING, fields, is_dataclass
+from datetime import date, datetime
+from inspect import getattr_static
+
+import pandas as pd
+
+from tableclasses.arrow import tabled as arrow_tabled
+from tableclasses.arrow.gen import types as arrow_types
+from tableclasses.base.field import field
+from tableclasses.dc import Deferred
+from tableclasses.pandas import tabled as pandas_tabled
+from tableclasses.pandas.gen import types as pandas_types
+
+from .test_arrow import deep_equals as arrow_equals
+from .test_arrow import get_expect as arrow_expect
+from .test_pandas import deep_equals as pandas_equals
+from .test_pandas import get_expect as pandas_expect
+from .utils import get_data, get_row_dicts
+
+# compiling runs in worker threads so a deadlock fails the test instead of hanging it
+TIMEOUT = 30
+
+
+class Shared:
+    a: int = field("int32")
+    b: str = field("string")
+    c: float = field("float64")
+    d: datetime = field("datetime")
+    e: date = field("date")
+
+
+LazyArrow = arrow_tabled(Shared, lazy=True)
+LazyPandas = pandas_tabled(Shared, lazy=True)
+
+
+class Raced:
+    a: int = field("int32")
+    c: float = field("float64")
+
+
+def test_deferred_until_used():
+    assert isinstance(getattr_static(LazyArrow, "__known__"), Deferred)
+    assert isinstance(getattr_static(LazyPandas, "__known__"), Deferred)
+    assert not is_dataclass(Shared)
+    assert Shared not in arrow_types.compiled
+
+    with ThreadPoolExecutor(1) as pool:
+        t = pool.submit(LazyArrow.from_columns, get_data()).result(TIMEOUT)
+    arrow_equals(arrow_expect(), t)
+    assert isinstance(getattr_static(LazyArrow, "__known__"), list)
+    assert isinstance(getattr_static(LazyPandas, "__known__"), Deferred)
+
+    # the pandas model has a field named `c`, which dataclass() looks up while the model compiles
+    with ThreadPoolExecutor(1) as pool:
+        df = pool.submit(LazyPandas.from_rows, get_row_dicts()).result(TIMEOUT)
+    pandas_equals(pandas_expect(), df)
+    assert is_dataclass(LazyPandas)
+    assert LazyPandas.__name__ == "Shared"
+    assert [f.name for f in fields(LazyPandas)] == ["a", "b", "c", "d", "e"]
+    for f in fields(LazyPandas):
+        assert f.default is MISSING
+    assert Shared in arrow_types.compiled
+    assert Shared in pandas_types.compiled
+
+    # the backends keep their own field metadata
+    assert LazyArrow.__known__[0].metadata["arrow"] != LazyPandas.__known__[0].metadata["arrow"]
+    assert isinstance(LazyPandas.__known__[0].metadata["arrow"], pd.ArrowDtype)
+
+
+def test_concurrent_compile():
+    models = [arrow_tabled(Raced, lazy=True), pandas_tabled(Raced, lazy=True)] * 4
+    with ThreadPoolExecutor(len(models)) as pool:
+        futures = [pool.submit(lambda model: model.arrow_schema(), model) for model in models]
+        schemas = [future.result(TIMEOUT) for future in futures]
+    assert all(schema == schemas[0] for schema in schemas)
+    assert arrow_types.compiled[Raced] is models[0].__known__
+    assert pandas_types.compiled[Raced] is models[1].__known__
+
+
+def test_schema_cached():
+    assert LazyArrow.arrow_schema() is LazyArrow.arrow_schema()
+    assert LazyArrow.arrow_schema() == LazyPandas.arrow_schema()
@@ -0,0 +1,90 @@
+import numpy as np
+import pyarrow as pa
+
+from tableclasses.arrow import tabled as arrow_tabled
+from tableclasses.base.field import field
+from tableclasses.errs import DataError
+from tableclasses.pandas import tabled as pandas_tabled
+
+from .utils import not_caught
+
+
+@arrow_tabled
+class Features:
+    name: str = field("string")
+    a: float = field("float64")
+    b: int = field("int32")
+    flag: bool = field("bool")
+
+
+@pandas_tabled
+class PandasFeatures:
+    a: float = field("float64")
+    b: int = field("int64", index=True)
+
+
+DATA = {"name": ["x", "y", "z"], "a": [0.5, 1.5, 2.5], "b": [1, 2, 3], "flag": [True, False, True]}
+
+
+def test_to_matrix():
+    t = Features.from_columns(DATA)
+    out = Features.to_matrix(t)
+    assert out.shape == (3, 3)
+    assert out.flags.f_contiguous
+    assert out.tolist() == [[0.5, 1.0, 1.0], [1.5, 2.0, 0.0], [2.5, 3.0, 1.0]]
+
+    rows = Features.to_matrix(t, fields=["b", Features.c.a], dtype=np.float32, order="C")
+    assert rows.dtype == np.float32
+    assert rows.flags.c_contiguous
+    assert rows.tolist() == [[1.0, 0.5], [2.0, 1.5], [3.0, 2.5]]
+
+    # chunks are written into place one after another
+    chunked = pa.concat_tables([t.slice(0, 1), t.slice(1)])
+    assert np.array_equal(Features.to_matrix(chunked), out)
+
+    df = PandasFeatures.from_columns({"a": [1.0, None], "b": [1, 2]})
+    assert np.array_equal(PandasFeatures.to_matrix(df), [[1.0, 1.0], [np.nan, 2.0]], equal_nan=True)
+
+
+def test_zero_copy():
+    t = Features.from_columns(DATA)
+    # copies are writable whatever the number of columns
+    for fields in (["a"], ["a", "b"]):
+        out = Features.to_matrix(t, fields=fields)
+        out[0, 0] = 10.0
+        assert t.column("a")[0].as_py() == 0.5
+
+    view = Features.to_matrix(t, fields=["a"], copy=False)
+    assert view.shape == (3, 1)
+    assert not view.flags.writeable
+    assert np.shares_memory(view, t.column("a").chunk(0).to_numpy())
+    assert not np.shares_memory(Features.to_matrix(t, fields=["a"], dtype=np.float32, copy=False), view)
+    assert Features.to_matrix(t, fields=["a", "b"], copy=False).flags.writeable
+
+
+def test_to_matrix_errors():
+    t = Features.from_columns(DATA)
+    try:
+        Features.to_matrix(t, fields=["name"])
+        not_caught()
+    except DataError:
+        pass
+
+    try:
+        Features.to_matrix(t, fields=["a"], dtype=np.int64)
+        not_caught()
+    except DataError:
+        pass
+
+    try:
+        Features.to_matrix(t, order="K")
+        not_caught()
+    except DataError:
+        pass
+
+    with_nulls = Features.from_columns({**DATA, "b": [1, None, 3]})
+    try:
+        Features.to_matrix(with_nulls, fields=["b"], dtype=np.int64)
+        not_caught()
+    except DataError:
+        pass
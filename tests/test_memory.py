@@ -0,0 +1,59 @@
+import pyarrow as pa
+
+from tableclasses.arrow import tabled as arrow_tabled
+from tableclasses.base.field import field
+from tableclasses.pandas import tabled as pandas_tabled
+
+
+@arrow_tabled
+class ArrowModel:
+    a: int = field("int64")
+    b: str = field("string")
+    c: float = field("float64")
+    d: float = field("float64")
+
+
+@pandas_tabled
+class PandasModel:
+    a: int = field("int64", index=True)
+    b: str = field("string")
+    c: float = field("float64")
+
+
+DATA = {
+    "a": [1, 2, 300, None],
+    "b": ["x", "y", "x", "x"],
+    "c": [0.5, 1.25, None, float("nan")],
+    "d": [0.1, 0.2, 0.3, 0.4],
+}
+
+
+def test_memory_report():
+    report = ArrowModel.memory_report(ArrowModel.from_columns(DATA)).to_pylist()
+    assert [row["column"] for row in report] == ["a", "b", "c", "d"]
+    assert [row["null_count"] for row in report] == [1, 0, 1, 0]
+    assert [row["cardinality"] for row in report] == [4, 2, 4, 4]
+    assert [row["suggested"] for row in report] == [
+        "int16",
+        "dictionary<values=string, indices=int8, ordered=0>",
+        "float",
+        None,
+    ]
+    assert report[0]["bytes"] > 0
+
+
+def test_optimize():
+    table = ArrowModel.from_columns(DATA)
+    out = ArrowModel.optimize(table)
+    assert out.schema.field("a").type == pa.int16()
+    assert out.schema.field("c").type == pa.float32()
+    assert out.schema.field("d").type == pa.float64()
+    assert pa.types.is_dictionary(out.schema.field("b").type)
+    assert out.column("b").to_pylist() == DATA["b"]
+    assert out.nbytes < table.nbytes
+
+    df = PandasModel.from_columns({name: DATA[name] for name in "abc"})
+    out = PandasModel.optimize(df)
+    assert out.index.name == "a"
+    assert str(out.index.dtype) == "int16[pyarrow]"
+    assert list(out["b"]) == ["x", "y", "x", "x"]
@@ -0,0 +1,80 @@
+from tableclasses.arrow import tabled as arrow_tabled
+from tableclasses.base.field import field
+from tableclasses.errs import DataError
+from tableclasses.pandas import tabled as pandas_tabled
+
+from .utils import not_caught
+
+
+@arrow_tabled
+class ArrowModel:
+    a: int = field("int64", index=True)
+    b: str = field("string", index=True)
+    c: float = field("float64")
+
+
+@arrow_tabled
+class Unkeyed:
+    a: int = field("int64")
+
+
+@pandas_tabled
+class PandasModel:
+    a: int = field("int64", index=True)
+    c: float = field("float64")
+
+
+OLD = {"a": [1, 2, 3, 4], "b": ["x", "x", "y", "y"], "c": [1.0, 2.0, None, 4.0]}
+NEW = {"a": [2, 3, 4, 5], "b": ["x", "y", "y", "y"], "c": [2.0, 3.0, 4.5, 5.0]}
+
+
+def test_upsert_arrow():
+    out = ArrowModel.upsert(ArrowModel.from_columns(OLD), ArrowModel.from_columns(NEW))
+    assert (out.inserted, out.updated, out.deleted) == (1, 3, 0)
+    assert out.table.schema == ArrowModel.arrow_schema()
+    rows = sorted(zip(*(out.table.column(name).to_pylist() for name in "abc")))
+    assert rows == [(1, "x", 1.0), (2, "x", 2.0), (3, "y", 3.0), (4, "y", 4.5), (5, "y", 5.0)]
+
+
+def test_upsert_duplicate_base_keys():
+    base = ArrowModel.from_columns({"a": [1, 1, 2], "b": ["x", "x", "x"], "c": [1.0, 1.5, 2.0]})
+    delta = ArrowModel.from_columns({"a": [1, 3], "b": ["x", "x"], "c": [9.0, 3.0]})
+    out = ArrowModel.upsert(base, delta)
+    assert (out.inserted, out.updated) == (1, 1)
+    assert sorted(out.table.column("c").to_pylist()) == [2.0, 3.0, 9.0]
+
+
+def test_diff_arrow():
+    out = ArrowModel.diff(ArrowModel.from_columns(OLD), ArrowModel.from_columns(NEW))
+    assert (out.inserted, out.updated, out.deleted) == (1, 2, 1)
+    assert sorted(out.table.column("a").to_pylist()) == [3, 4, 5]
+    assert out.removed.column("a").to_pylist() == [1]
+
+
+def test_pandas_merge():
+    old = PandasModel.from_columns({"a": [1, 2], "c": [1.0, 2.0]})
+    new = PandasModel.from_columns({"a": [2, 3], "c": [2.5, 3.0]})
+    out = PandasModel.upsert(old, new)
+    assert isinstance(out.table, PandasModel)
+    assert out.table.sort_index()["c"].tolist() == [1.0, 2.5, 3.0]
+
+    out = PandasModel.diff(old, new)
+    assert (out.inserted, out.updated, out.deleted) == (1, 1, 1)
+    assert list(out.removed.index) == [1]
+    # instances keep pandas' own diff
+    assert new.diff()["c"].tolist()[1] == 0.5
+
+
+def test_merge_errors():
+    try:
+        Unkeyed.upsert(Unkeyed.from_columns({"a": [1]}), Unkeyed.from_columns({"a": [1]}))
+        not_caught()
+    except DataError:
+        pass
+
+    dup = ArrowModel.from_columns({"a": [1, 1], "b": ["x", "x"], "c": [1.0, 2.0]})
+    try:
+        ArrowModel.upsert(ArrowModel.from_columns(OLD), dup)
+        not_caught()
+    except DataError:
+        pass
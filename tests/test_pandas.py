@@ -9,7 +9,7 @@ from beartype.roar import BeartypeCallHintParamViolation
 from pandas import ArrowDtype as Dtype
 
 from tableclasses.base.field import field
-from tableclasses.errs import ColumnError, DataError, RowError
+from tableclasses.errs import ColumnError, DataError, ReservedNameError, RowError
 from tableclasses.pandas import tabled
 
 from .utils import get_data, get_row_dicts, not_caught, rename_col_ord
@@ -335,3 +335,79 @@ def test_perf():
             timed.to_markdown(f)
     else:
         print(timed.to_markdown())  # noqa: T201
+
+
+def test_arrow_first():
+    data = get_data()
+    source = pd.DataFrame(data).convert_dtypes(dtype_backend="pyarrow")
+    assert source.a.dtype == Dtype(pa.int64())
+    t = TestFielded.from_existing(source)
+    deep_equals(get_expect(), t)
+
+    t = TestFielded.from_columns({**data, "c": [1.0, None, 3.0]})
+    assert t.c.isna().tolist() == [False, True, False]
+    assert t.c.dtype == Dtype(pa.float64())
+
+
+@tabled
+class TestMultiIndexed:
+    a: int = field("int32", index=True)
+    e: date = field("date", index=True)
+    b: str = field("string")
+    c: float = field("float64")
+    d: datetime = field("datetime")
+
+
+def test_index_built_from_arrow():
+    data = get_data()
+    t = TestIndexed.from_columns(data, verify_index=True)
+    assert list(t.columns) == ["b", "c", "d", "e"]
+    assert t.index.dtype == Dtype(pa.int32())
+    assert t.index.is_monotonic_increasing
+    assert t.loc[2, "b"] == "b"
+
+    t = TestMultiIndexed.from_rows(get_row_dicts())
+    assert t.index.names == ["a", "e"]
+    assert t.index.levels[1].dtype == Dtype(pa.date32())
+    deep_equals(get_expect().set_index(["a", "e"]), t)
+
+
+def test_verify_index():
+    data = {**get_data(), "a": [1, 1, 2]}
+    t = TestIndexed.from_columns(data)
+    assert not t.index.is_unique
+    try:
+        TestIndexed.from_columns(data, verify_index=True)
+        not_caught()
+    except RuntimeError as e:
+        raise e
+    except DataError:
+        pass
+
+
+def test_reserved_field_names():
+    class Clashing:
+        a: int = field("int64")
+        stats: float = field("float64")
+
+    try:
+        tabled(Clashing)
+        not_caught()
+    except ReservedNameError:
+        pass
+
+    lazy = tabled(Clashing, lazy=True)
+    for _ in range(2):
+        try:
+            lazy.__known__  # noqa: B018
+            not_caught()
+        except ReservedNameError:
+            pass
+
+    class Renamed:
+        a: int = field("int64")
+        stats_: float = field("float64", aliases=["stats"])
+
+    t = tabled(Renamed).from_columns({"a": [1], "stats": [2.0]})
+    assert t["stats_"].tolist() == [2.0]
+    assert callable(type(t).stats)
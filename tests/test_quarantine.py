@@ -0,0 +1,84 @@
+import pyarrow as pa
+
+from tableclasses.arrow import tabled as arrow_tabled
+from tableclasses.base.field import field
+from tableclasses.base.quarantine import Quarantined
+from tableclasses.errs import DataError, RowError
+from tableclasses.pandas import tabled as pandas_tabled
+
+from .utils import not_caught
+
+
+@arrow_tabled
+class ArrowModel:
+    a: int = field("int8", ge=0)
+    b: str = field("string")
+
+
+@pandas_tabled
+class PandasModel:
+    a: int = field("int64", index=True)
+    b: float = field("float64", not_null=True)
+
+
+def test_quarantine_columns():
+    out = ArrowModel.from_columns({"a": [1, "x", 300, -1, 5], "b": ["p", "q", "r", "s", None]}, errors="quarantine")
+    assert isinstance(out, Quarantined)
+    assert out.table.schema.equals(ArrowModel.arrow_schema())
+    assert out.table.column("a").to_pylist() == [1, 5]
+    assert out.rejected.column("row").to_pylist() == [1, 2, 3]
+    assert out.rejected.column("column").to_pylist() == ["a", "a", "a"]
+    assert out.rejected.column("reason")[2].as_py() == "violates ge"
+
+    # arrow arrays are checked with safe casts
+    arr = pa.array([1, 1000, 2], type=pa.int64())
+    out = ArrowModel.from_columns({"a": arr, "b": ["p", "q", "r"]}, errors="quarantine")
+    assert out.table.column("a").to_pylist() == [1, 2]
+    assert out.rejected.column("row").to_pylist() == [1]
+
+    clean = ArrowModel.from_columns({"a": [1, 2], "b": ["p", "q"]}, errors="quarantine")
+    assert clean.table.num_rows == 2
+    assert clean.rejected.num_rows == 0
+
+    try:
+        ArrowModel.from_columns({"a": [1, "x"], "b": ["p", "q"]})
+        not_caught()
+    except pa.ArrowInvalid:
+        pass
+
+    try:
+        ArrowModel.from_columns({"a": [1], "b": ["p"]}, errors="ignore")
+        not_caught()
+    except DataError:
+        pass
+
+
+def test_quarantine_rows():
+    rows = [
+        {"a": 1, "b": 1.5},
+        {"a": "two", "b": 2.5},
+        {"a": 3},
+        {"a": 4, "b": None},
+        {"a": 5, "b": "5.5x"},
+        {"a": 6, "b": 6.5},
+    ]
+    out = PandasModel.from_rows(rows, errors="quarantine", stats=True)
+    assert isinstance(out.table, PandasModel)
+    assert out.table.index.tolist() == [1, 6]
+    assert out.table["b"].tolist() == [1.5, 6.5]
+    assert PandasModel.stats(out.table)["b"].count == 2
+
+    rejected = out.rejected.to_pylist()
+    assert [r["row"] for r in rejected] == [1, 2, 3, 4]
+    assert rejected[1]["column"] is None
+    assert rejected[2] == {"row": 3, "column": "b", "reason": "violates not_null"}
+
+    try:
+        PandasModel.from_rows(rows)
+        not_caught()
+    except RowError:
+        pass
+
+    cols = PandasModel.from_columns({"a": [1, 2], "b": [0.5, "nan?"]}, errors="quarantine")
+    assert cols.table["b"].tolist() == [0.5]
+    assert cols.rejected.column("column").to_pylist() == ["b"]
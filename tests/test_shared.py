@@ -0,0 +1,104 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+import pyarrow as pa
+
+from tableclasses.arrow import tabled as arrow_tabled
+from tableclasses.base.field import MODEL_KEY, field
+from tableclasses.pandas import tabled as pandas_tabled
+
+from .utils import get_data
+
+
+@arrow_tabled
+class ArrowModel:
+    a: int = field("int64")
+    b: str = field("string")
+    c: float = field("float64")
+
+
+@pandas_tabled
+class PandasModel:
+    a: int = field("int64", index=True)
+    b: str = field("string")
+    c: float = field("float64")
+
+
+def columns():
+    data = get_data()
+    return {name: data[name] for name in "abc"}
+
+
+def total(handle):
+    df = PandasModel.from_shared(handle)
+    return type(df).__name__, float(df["c"].sum())
+
+
+def test_shared_arrow():
+    t = ArrowModel.from_columns(columns())
+    handle = ArrowModel.to_shared(t)
+    try:
+        out = ArrowModel.from_shared(handle)
+        assert out.equals(t)
+        assert out.schema == ArrowModel.arrow_schema()
+        assert pickle.loads(pickle.dumps(handle)) == handle  # noqa: S301
+    finally:
+        handle.unlink()
+
+
+def test_shared_pandas():
+    df = PandasModel.from_columns(columns())
+    handle = PandasModel.to_shared(df)
+    try:
+        out = PandasModel.from_shared(handle)
+        assert isinstance(out, PandasModel)
+        assert out.equals(df)
+        assert list(out.index) == [1, 2, 3]
+    finally:
+        handle.unlink()
+
+
+def test_shared_process():
+    handle = PandasModel.to_shared(PandasModel.from_columns(columns()))
+    try:
+        with ProcessPoolExecutor(1, mp_context=get_context("fork")) as pool:
+            assert pool.submit(total, handle).result(timeout=30) == ("PandasModel", 6.0)
+    finally:
+        handle.unlink()
+
+
+def test_pickle_out_of_band():
+    df = PandasModel.from_columns(columns())
+    buffers = []
+    data = pickle.dumps(df, protocol=5, buffer_callback=buffers.append)
+    assert len(buffers) > 0
+    out = pickle.loads(data, buffers=buffers)  # noqa: S301
+    assert isinstance(out, PandasModel)
+    assert out.equals(df)
+
+    out = pickle.loads(pickle.dumps(df))  # noqa: S301
+    assert isinstance(out, PandasModel)
+    assert out.equals(df)
+
+    t = ArrowModel.from_columns(columns())
+    buffers = []
+    data = pickle.dumps(t, protocol=5, buffer_callback=buffers.append)
+    assert len(buffers) > 0
+    assert pickle.loads(data, buffers=buffers).equals(t)  # noqa: S301
+
+
+def test_pickle_untyped():
+    df = PandasModel.from_columns(columns())
+    df["d"] = 1
+    out = pickle.loads(pickle.dumps(df, protocol=5))  # noqa: S301
+    assert list(out.columns) == ["b", "c", "d"]
+    assert isinstance(pa.Table.from_pandas(out), pa.Table)
+
+
+def test_pickle_changed_dtype():
+    df = PandasModel.from_columns(columns())
+    df["b"] = [1.5, 2.5, 3.5]
+    out = pickle.loads(pickle.dumps(df))  # noqa: S301
+    assert out["b"].tolist() == [1.5, 2.5, 3.5]
+    assert MODEL_KEY not in (pa.RecordBatchReader.from_stream(df).schema.metadata or {})
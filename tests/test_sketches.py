@@ -0,0 +1,93 @@
+import io
+import json
+
+import pyarrow as pa
+
+from tableclasses.arrow import tabled as arrow_tabled
+from tableclasses.base.field import field
+from tableclasses.base.sketches import TableStats
+from tableclasses.errs import DataError
+from tableclasses.pandas import tabled as pandas_tabled
+
+from .utils import not_caught
+
+
+@arrow_tabled
+class ArrowModel:
+    key: str = field("string")
+    value: float = field("float64")
+
+
+@pandas_tabled
+class PandasModel:
+    key: str = field("string", index=True)
+    value: int = field("int64")
+
+
+N = 100_000
+
+
+def table() -> pa.Table:
+    return ArrowModel.from_columns({"key": [f"k{i}" for i in range(N)], "value": [float(i) for i in range(N)]})
+
+
+def test_stream_stats():
+    t = table()
+    out = ArrowModel.stream(t, batch_size=10_000).to_table(stats=True)
+    stats = ArrowModel.stats(out)
+    assert list(stats) == ["key", "value"]
+    assert stats["key"].count == N
+    assert stats["key"].nulls == 0
+    assert abs(stats["key"].approx_distinct() - N) < N * 0.03
+    assert stats["key"].quantile(0.5) is None
+    assert stats["value"].min == 0.0
+    assert stats["value"].max == N - 1
+    assert abs(stats["value"].quantile(0.5) - N / 2) < N * 0.01
+    assert abs(stats["value"].quantile(0.99) - N * 0.99) < N * 0.005
+
+
+def test_column_stats():
+    t = ArrowModel.from_columns({"key": ["a", "b", None], "value": [1.0, 2.0, 3.0]}, stats=True)
+    assert ArrowModel.stats(t)["key"].nulls == 1
+    assert ArrowModel.stats(t)["value"].max == 3.0
+
+    df = PandasModel.from_columns({"key": ["a", "b"], "value": [5, 7]}, stats=[PandasModel.c.value])
+    stats = PandasModel.stats(df)
+    assert list(stats) == ["value"]
+    assert (stats["value"].min, stats["value"].max) == (5, 7)
+
+
+def test_merge_partitions():
+    t = table()
+    left = ArrowModel.stream(t.slice(0, N // 2)).to_table(stats=["value"])
+    right = ArrowModel.stream(t.slice(N // 2)).to_table(stats=[ArrowModel.c.value])
+    merged = ArrowModel.stats(left).merge(ArrowModel.stats(right))
+    assert list(merged) == ["value"]
+    assert merged["value"].count == N
+    assert (merged["value"].min, merged["value"].max) == (0.0, N - 1)
+    assert abs(merged["value"].approx_distinct() - N) < N * 0.03
+    assert abs(merged["value"].quantile(0.25) - N / 4) < N * 0.01
+
+
+def test_row_and_json_stats():
+    rows = [{"key": str(i % 10), "value": i} for i in range(1000)] + [{"key": None, "value": None}]
+    df = PandasModel.from_rows(rows, stats=True)
+    stats = PandasModel.stats(df)
+    assert stats["key"].nulls == 1
+    assert stats["key"].approx_distinct() == 10
+    assert stats["value"].max == 999
+
+    lines = "\n".join(json.dumps(row) for row in rows).encode()
+    out = PandasModel.read_json(io.BytesIO(lines), stats=["value"])
+    assert PandasModel.stats(out)["value"].count == 1001
+
+    # tables built without stats= are profiled on first request
+    plain = PandasModel.from_rows(rows)
+    assert isinstance(PandasModel.stats(plain), TableStats)
+    assert PandasModel.stats(plain) is PandasModel.stats(plain)
+
+    try:
+        ArrowModel.stream(table()).map_batches(lambda b: b).to_table(stats=True)
+        not_caught()
+    except DataError:
+        pass
@@ -0,0 +1,74 @@
+import io
+import json
+from pathlib import Path
+
+import pyarrow as pa
+
+from tableclasses.arrow import tabled as arrow_tabled
+from tableclasses.base.field import field
+from tableclasses.base.spill import Spill
+from tableclasses.pandas import tabled as pandas_tabled
+
+from .utils import not_caught
+
+
+@arrow_tabled
+class ArrowModel:
+    a: int = field("int64")
+    b: str = field("string")
+
+
+@pandas_tabled
+class PandasModel:
+    a: int = field("int64", index=True)
+    b: str = field("string")
+
+
+def table(n: int) -> pa.Table:
+    return ArrowModel.from_columns({"a": list(range(n)), "b": [str(i) for i in range(n)]})
+
+
+def test_spill(tmp_path):
+    t = table(1000)
+    spill = Spill(t.schema, budget=4096, directory=str(tmp_path))
+    spill.extend(t.to_batches(max_chunksize=100))
+    assert spill.path is not None
+    assert spill.size <= 4096
+    out = spill.finish()
+    assert out.equals(t)
+    assert not Path(spill.path).exists()
+
+
+class SourceFailedError(Exception):
+    pass
+
+
+def test_spill_discard(tmp_path):
+    def failing():
+        yield from table(1000).to_batches(max_chunksize=100)
+        msg = "failed"
+        raise SourceFailedError(msg)
+
+    spill = Spill(ArrowModel.arrow_schema(), budget=1024, directory=str(tmp_path))
+    try:
+        spill.extend(failing())
+        not_caught()
+    except SourceFailedError:
+        # the batches before the failure went to disk
+        assert len(list(tmp_path.iterdir())) == 1
+        spill.discard()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_budgeted_constructors():
+    t = table(1000)
+    out = ArrowModel.stream(t, batch_size=10).to_table(memory_budget=1024)
+    assert out.equals(t)
+
+    df = PandasModel.stream(t.to_batches(max_chunksize=10)).to_table(memory_budget=1024)
+    assert isinstance(df, PandasModel)
+    assert len(df) == 1000
+
+    lines = "\n".join(json.dumps({"a": i, "b": str(i)}) for i in range(1000)).encode()
+    out = ArrowModel.read_json(io.BytesIO(lines), block_size=1 << 10, memory_budget=1024)
+    assert out.equals(t)
@@ -0,0 +1,94 @@
+from datetime import date
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from tableclasses.arrow import tabled as arrow_tabled
+from tableclasses.base.field import field
+from tableclasses.errs import DataError
+from tableclasses.pandas import tabled as pandas_tabled
+
+from .utils import not_caught
+
+
+@arrow_tabled
+class RawEvent:
+    day: str = field("string")
+    user: str = field("string")
+    value: int = field("int64")
+
+
+@arrow_tabled
+class CleanEvent:
+    day: date = field("date")
+    user: str = field("string", aliases=["account"])
+    value: float = field("float64", ge=0)
+
+
+@pandas_tabled
+class PandasEvent:
+    day: date = field("date", index=True)
+    value: float = field("float64")
+
+
+RAW = {
+    "day": ["2023-08-01", "2023-08-02", "2023-08-03", "2023-08-04"],
+    "user": ["a", "b", "c", "d"],
+    "value": [1, -2, 3, 4],
+}
+
+
+def clean(batch: pa.RecordBatch) -> pa.RecordBatch:
+    batch = batch.filter(pc.greater_equal(batch.column("value"), 0))
+    return batch.rename_columns(["day", "account", "value"])
+
+
+def test_stream_into():
+    raw = RawEvent.from_columns(RAW)
+    stream = RawEvent.stream(raw, batch_size=2).map_batches(clean).into(CleanEvent)
+    batches = list(stream.to_batches())
+    assert len(batches) == 2
+    assert all(batch.schema == CleanEvent.arrow_schema() for batch in batches)
+
+    out = RawEvent.stream(raw, batch_size=1).map_batches(clean).into(CleanEvent).to_table()
+    assert out.schema == CleanEvent.arrow_schema()
+    assert out.column("value").to_pylist() == [1.0, 3.0, 4.0]
+    assert out.column("day").to_pylist()[0] == date(2023, 8, 1)
+
+
+def test_stream_pandas(tmp_path):
+    raw = RawEvent.from_columns(RAW)
+    frames = list(RawEvent.stream(raw, batch_size=3).map_batches(lambda b: b.drop_columns(["user"])).into(PandasEvent))
+    assert [len(frame) for frame in frames] == [3, 1]
+    assert all(isinstance(frame, PandasEvent) for frame in frames)
+
+    stream = RawEvent.stream(iter(raw.to_batches(max_chunksize=1)))
+    rows = stream.map_batches(lambda b: b.drop_columns(["user"])).into(PandasEvent).write(tmp_path / "out.parquet")
+    assert rows == 4
+    assert pq.read_table(tmp_path / "out.parquet").schema == PandasEvent.arrow_schema()
+
+    RawEvent.write_dataset(raw, tmp_path / "raw", partition_by=["day"])
+    dataset = RawEvent.open_dataset(tmp_path / "raw").filter(RawEvent.c.value > 0)
+    out = dataset.stream().map_batches(clean).into(CleanEvent).to_table()
+    assert sorted(out.column("user").to_pylist()) == ["a", "c", "d"]
+
+
+def test_stream_errors():
+    raw = RawEvent.from_columns(RAW)
+    try:
+        RawEvent.stream(raw).map_batches(lambda b: b.rename_columns(["day", "user", "value"])).into(
+            CleanEvent
+        ).to_table()
+        not_caught()
+    except DataError as e:
+        assert list(e.masks) == ["value"]
+
+    try:
+        RawEvent.stream(raw).map_batches(lambda b: b).to_reader()
+        not_caught()
+    except DataError:
+        pass
+
+    untyped = RawEvent.stream([raw]).map_batches(lambda b: b.select(["user"])).to_table()
+    assert untyped.column_names == ["user"]
@@ -0,0 +1,82 @@
+from datetime import date, timedelta
+
+import pyarrow as pa
+
+from tableclasses.arrow import tabled as arrow_tabled
+from tableclasses.base.field import field
+from tableclasses.base.zones import may_match
+from tableclasses.errs import DataError
+from tableclasses.pandas import tabled as pandas_tabled
+
+from .utils import not_caught
+
+
+@arrow_tabled
+class Event:
+    day: date = field("date", zone_map=True)
+    tenant: str = field("string", index=True, bloom=True)
+    value: float = field("float64")
+
+
+@pandas_tabled
+class PandasEvent:
+    tenant: str = field("string", index=True, bloom=True)
+    value: float = field("float64")
+
+
+START = date(2023, 8, 1)
+
+
+def events(days: int) -> pa.Table:
+    # one chunk per day, as when ingest batches are concatenated
+    batches = []
+    for i in range(days):
+        day = START + timedelta(days=i)
+        batches.append(
+            Event.from_columns({"day": [day] * 3, "tenant": [f"t{i}", f"t{i + 1}", None], "value": [1.0, 2.0, 3.0]})
+        )
+    return pa.concat_tables(batches)
+
+
+def test_zone_maps_cached():
+    t = events(5)
+    zones = Event.zone_maps(t)
+    assert len(zones) == 5
+    assert Event.zone_maps(t) is zones
+    assert zones[1].stats["day"].min == START + timedelta(days=1)
+    assert zones[1].stats["tenant"].nulls == 1
+    assert "value" not in zones[1].stats
+
+
+def test_zone_pruning():
+    t = events(10)
+    zones = Event.zone_maps(t)
+    where = (Event.c.day >= START + timedelta(days=8)) & (Event.c.value > 0)
+    assert [may_match(where, zone) for zone in zones] == [False] * 8 + [True] * 2
+
+    out = Event.filter(t, where)
+    assert out.num_rows == 6
+    assert set(out.column("day").to_pylist()) == {START + timedelta(days=8), START + timedelta(days=9)}
+
+    # t3 only occurs on days 2 and 3, the bloom filters rule out the others
+    matched = [may_match(Event.c.tenant == "t3", zone) for zone in zones]
+    assert sum(matched) <= 4
+    assert matched[2] and matched[3]
+    assert Event.filter(t, Event.c.tenant.isin(["t3", "missing"])).num_rows == 2
+    assert Event.filter(t, Event.c.tenant.is_null()).num_rows == 10
+    assert Event.filter(t, Event.c.day < START).num_rows == 0
+    assert Event.filter(t, ~(Event.c.day < START)).num_rows == 30
+
+
+def test_lookup():
+    t = events(4)
+    assert Event.lookup(t, "t2").column("day").to_pylist() == [START + timedelta(days=1), START + timedelta(days=2)]
+
+    df = PandasEvent.from_columns({"tenant": ["a", "b"], "value": [1.0, 2.0]})
+    assert PandasEvent.lookup(df, "b")["value"].tolist() == [2.0]
+
+    try:
+        Event.lookup(t)
+        not_caught()
+    except DataError:
+        pass